@@ -1,7 +1,13 @@
+import copy
+import threading
+from functools import lru_cache
+
 from mindsdb_sql.exceptions import ParsingException
 
+_thread_local = threading.local()
 
-def get_lexer_parser(dialect):
+
+def _make_lexer_parser(dialect):
     if dialect == 'sqlite':
         from mindsdb_sql.parser.lexer import SQLLexer
         from mindsdb_sql.parser.parser import SQLParser
@@ -19,8 +25,30 @@ def get_lexer_parser(dialect):
     return lexer, parser
 
 
-def parse_sql(sql, dialect='sqlite'):
-    lexer, parser = get_lexer_parser(dialect)
-    tokens = lexer.tokenize(sql)
-    ast = parser.parse(tokens)
+def get_lexer_parser(dialect):
+    # sly keeps the parse state on the lexer and parser instances, so each thread reuses its own pair
+    lexer_parsers = getattr(_thread_local, 'lexer_parsers', None)
+    if lexer_parsers is None:
+        lexer_parsers = _thread_local.lexer_parsers = {}
+    if dialect not in lexer_parsers:
+        lexer_parsers[dialect] = _make_lexer_parser(dialect)
+    return lexer_parsers[dialect]
+
+
+def parse_tokens(tokens, dialect='sqlite'):
+    # Lets callers that already tokenized the query (e.g. to inspect tokens) skip lexing it again
+    _, parser = get_lexer_parser(dialect)
+    ast = parser.parse(iter(tokens))
     return ast
+
+
+@lru_cache(maxsize=1024)
+def _parse_sql_cached(sql, dialect):
+    lexer, parser = get_lexer_parser(dialect)
+    return parse_tokens(lexer.tokenize(sql), dialect)
+
+
+def parse_sql(sql, dialect='sqlite'):
+    # Cached trees are shared, callers (e.g. the planner) are free to mutate the returned copy
+    ast = _parse_sql_cached(sql.strip(), dialect)
+    return copy.deepcopy(ast)
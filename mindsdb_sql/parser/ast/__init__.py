@@ -1,5 +1,7 @@
+from mindsdb_sql.utils import lazy_module_getattr
+
 from .base import ASTNode
-from .select import *
+from . import select
 from .show import *
 from .use import *
 from .describe import *
@@ -9,3 +11,13 @@ from .rollback_transaction import *
 from .commit_transaction import *
 from .explain import *
 from .alter_table import *
+
+__all__ = [
+    'ASTNode',
+    *select.__all__,
+    *show.__all__, *use.__all__, *describe.__all__, *set.__all__, *start_transaction.__all__,
+    *rollback_transaction.__all__, *commit_transaction.__all__, *explain.__all__, *alter_table.__all__,
+]
+
+# Select nodes are resolved lazily through the select package
+__getattr__, __dir__ = lazy_module_getattr(__name__, dict.fromkeys(select.__all__, 'select'))
@@ -1,8 +1,12 @@
 from mindsdb_sql.parser.ast.base import ASTNode
 from mindsdb_sql.utils import indent
 
+__all__ = ['AlterTable']
+
 
 class AlterTable(ASTNode):
+    __slots__ = ('target', 'arg')
+
     def __init__(self,
                  target,
                  arg,
@@ -1,8 +1,10 @@
 from mindsdb_sql import ParsingException
-from mindsdb_sql.utils import to_single_line
+from mindsdb_sql.utils import get_slot_fields
 
 
 class ASTNode:
+    __slots__ = ('alias', 'parentheses')
+
     def __init__(self, alias=None, parentheses=False):
         self.alias = alias
         self.parentheses = parentheses
@@ -35,7 +37,11 @@ class ASTNode:
         return self.to_string()
 
     def __eq__(self, other):
-        if isinstance(other, ASTNode):
-            return self.to_tree() == other.to_tree() and to_single_line(str(self)) == to_single_line(str(other))
-        else:
+        # Structural comparison, child nodes are compared by their own __eq__
+        if type(self) is not type(other):
             return False
+        for field in get_slot_fields(type(self)):
+            if getattr(self, field) != getattr(other, field):
+                return False
+        # Subclasses that don't declare __slots__ keep their attributes in __dict__
+        return getattr(self, '__dict__', None) == getattr(other, '__dict__', None)
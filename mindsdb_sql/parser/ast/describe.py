@@ -1,8 +1,12 @@
 from mindsdb_sql.parser.ast.base import ASTNode
 from mindsdb_sql.utils import indent
 
+__all__ = ['Describe']
+
 
 class Describe(ASTNode):
+    __slots__ = ('value',)
+
     def __init__(self,
                  value,
                  *args, **kwargs):
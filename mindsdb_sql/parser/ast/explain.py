@@ -1,8 +1,12 @@
 from mindsdb_sql.parser.ast.base import ASTNode
 from mindsdb_sql.utils import indent
 
+__all__ = ['Explain']
+
 
 class Explain(ASTNode):
+    __slots__ = ('target',)
+
     def __init__(self,
                  target,
                  *args, **kwargs):
@@ -1,8 +1,12 @@
 from mindsdb_sql.parser.ast.base import ASTNode
 from mindsdb_sql.utils import indent
 
+__all__ = ['RollbackTransaction']
+
 
 class RollbackTransaction(ASTNode):
+    __slots__ = ()
+
     def __init__(self,
                  *args, **kwargs):
         super().__init__(*args, **kwargs)
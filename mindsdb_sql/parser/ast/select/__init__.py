@@ -1,12 +1,26 @@
-from .select import Select
-from .common_table_expression import CommonTableExpression
-from .union import Union
-from .constant import Constant, NullConstant
-from .identifier import Identifier
-from .star import Star
-from .join import Join
-from .type_cast import TypeCast
-from .tuple import Tuple
-from .operation import Operation, BinaryOperation, UnaryOperation, BetweenOperation, Function
-from .order_by import OrderBy
-from .parameter import Parameter
+from mindsdb_sql.utils import lazy_module_getattr
+
+# Submodules are imported on first attribute access (PEP 562)
+_MODULES = {
+    'Select': 'select',
+    'CommonTableExpression': 'common_table_expression',
+    'Union': 'union',
+    'Constant': 'constant',
+    'NullConstant': 'constant',
+    'Identifier': 'identifier',
+    'Star': 'star',
+    'Join': 'join',
+    'TypeCast': 'type_cast',
+    'Tuple': 'tuple',
+    'Operation': 'operation',
+    'BinaryOperation': 'operation',
+    'UnaryOperation': 'operation',
+    'BetweenOperation': 'operation',
+    'Function': 'operation',
+    'OrderBy': 'order_by',
+    'Parameter': 'parameter',
+}
+
+__all__ = list(_MODULES)
+
+__getattr__, __dir__ = lazy_module_getattr(__name__, _MODULES)
@@ -3,6 +3,8 @@ from mindsdb_sql.utils import indent
 
 
 class Constant(ASTNode):
+    __slots__ = ('value',)
+
     def __init__(self, value, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.value = value
@@ -20,8 +22,14 @@ class Constant(ASTNode):
             out_str = str(self.value)
         return out_str
 
+    def __eq__(self, other):
+        # 1, 1.0 and True are equal in python, but are different constants in a query
+        return super().__eq__(other) and type(self.value) is type(other.value)
+
 
 class NullConstant(Constant):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(value=None, *args, **kwargs)
 
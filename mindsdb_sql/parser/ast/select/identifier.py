@@ -11,6 +11,8 @@ def path_str_to_parts(path_str):
 
 
 class Identifier(ASTNode):
+    __slots__ = ('parts',)
+
     def __init__(self, path_str=None, parts=None, *args, **kwargs):
         super().__init__(*args, **kwargs)
         assert path_str or parts, "Either path_str or parts must be provided for an Identifier"
@@ -4,6 +4,8 @@ from mindsdb_sql.utils import indent
 
 
 class Operation(ASTNode):
+    __slots__ = ('op', 'args')
+
     def __init__(self, op, args, *args_, **kwargs):
         super().__init__(*args_, **kwargs)
 
@@ -31,6 +33,8 @@ class Operation(ASTNode):
 
 
 class BetweenOperation(Operation):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(op='between', *args, **kwargs)
 
@@ -40,6 +44,8 @@ class BetweenOperation(Operation):
 
 
 class BinaryOperation(Operation):
+    __slots__ = ()
+
     def get_string(self, *args, **kwargs):
         arg_strs = [arg.to_string() for arg in self.args]
         return f'{arg_strs[0]} {self.op.upper()} {arg_strs[1]}'
@@ -50,6 +56,8 @@ class BinaryOperation(Operation):
 
 
 class UnaryOperation(Operation):
+    __slots__ = ()
+
     def get_string(self, *args, **kwargs):
         return f'{self.op} {self.args[0].to_string()}'
 
@@ -59,6 +67,8 @@ class UnaryOperation(Operation):
 
 
 class Function(Operation):
+    __slots__ = ('distinct',)
+
     def __init__(self, *args, distinct=False, **kwargs):
         super().__init__(*args, **kwargs)
         self.distinct = distinct
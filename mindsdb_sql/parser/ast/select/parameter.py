@@ -2,6 +2,8 @@ from mindsdb_sql.parser.ast.base import ASTNode
 
 
 class Parameter(ASTNode):
+    __slots__ = ('value',)
+
     def __init__(self, value, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.value = value
@@ -3,6 +3,7 @@ from mindsdb_sql.utils import indent
 
 
 class Select(ASTNode):
+    __slots__ = ('targets', 'distinct', 'from_table', 'where', 'group_by', 'having', 'order_by', 'limit', 'offset', 'cte')
 
     def __init__(self,
                  targets,
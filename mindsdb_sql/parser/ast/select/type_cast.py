@@ -3,6 +3,8 @@ from mindsdb_sql.utils import indent
 
 
 class TypeCast(ASTNode):
+    __slots__ = ('type_name', 'arg')
+
     def __init__(self, type_name, arg, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
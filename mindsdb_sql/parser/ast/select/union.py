@@ -3,6 +3,7 @@ from mindsdb_sql.utils import indent
 
 
 class Union(ASTNode):
+    __slots__ = ('left', 'right', 'unique')
 
     def __init__(self,
                  left,
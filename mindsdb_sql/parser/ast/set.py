@@ -1,8 +1,12 @@
 from mindsdb_sql.parser.ast.base import ASTNode
 from mindsdb_sql.utils import indent
 
+__all__ = ['Set']
+
 
 class Set(ASTNode):
+    __slots__ = ('category', 'arg')
+
     def __init__(self,
                  category=None,
                  arg=None,
@@ -1,8 +1,12 @@
 from mindsdb_sql.parser.ast.base import ASTNode
 from mindsdb_sql.utils import indent
 
+__all__ = ['Show']
+
 
 class Show(ASTNode):
+    __slots__ = ('category', 'condition', 'expression')
+
     def __init__(self,
                  category,
                  condition=None,
@@ -1,8 +1,13 @@
 from mindsdb_sql.parser.ast.base import ASTNode
+from mindsdb_sql.parser.ast.select.identifier import Identifier
 from mindsdb_sql.utils import indent
 
+__all__ = ['Use']
+
 
 class Use(ASTNode):
+    __slots__ = ('value',)
+
     def __init__(self,
                  value,
                  *args, **kwargs):
@@ -11,13 +16,12 @@ class Use(ASTNode):
 
     def to_tree(self, *args, level=0, **kwargs):
         ind = indent(level)
-        value_str = f'value={self.value.to_tree(level=level+2)},'
-
-        out_str = f'{ind}Use(' \
-                  f'{value_str}' \
-                  f'\n{ind})'
-        return out_str
+        return f'{ind}Use(value={self.value.to_tree(level=level+2)},\n{ind})'
 
     def get_string(self, *args, **kwargs):
-        return f'USE {str(self.value)}'
+        value = self.value
+        if type(value) is Identifier and not value.alias and not value.parentheses:
+            # Plain identifier, render its parts directly instead of going through to_string
+            return 'USE ' + value.parts_to_str()
+        return f'USE {str(value)}'
 
@@ -1,10 +1,19 @@
-from .lexer import MindsDBLexer
-from .parser import MindsDBParser
+from mindsdb_sql.utils import lazy_module_getattr
 
-from .create_view import CreateView
-from .create_integration import CreateIntegration
-from .create_predictor import CreatePredictor
-from .drop_predictor import DropPredictor
-from .retrain_predictor import RetrainPredictor
-from .drop_integration import DropIntegration
-from .latest import Latest
\ No newline at end of file
+# Submodules are imported on first attribute access (PEP 562), so importing a node
+# such as Latest does not build the dialect parser tables
+_MODULES = {
+    'MindsDBLexer': 'lexer',
+    'MindsDBParser': 'parser',
+    'CreateView': 'create_view',
+    'CreateIntegration': 'create_integration',
+    'CreatePredictor': 'create_predictor',
+    'DropPredictor': 'drop_predictor',
+    'RetrainPredictor': 'retrain_predictor',
+    'DropIntegration': 'drop_integration',
+    'Latest': 'latest',
+}
+
+__all__ = list(_MODULES)
+
+__getattr__, __dir__ = lazy_module_getattr(__name__, _MODULES)
@@ -4,6 +4,8 @@ from mindsdb_sql.utils import indent
 
 
 class CreateIntegration(ASTNode):
+    __slots__ = ('name', 'engine', 'parameters')
+
     def __init__(self,
                  name,
                  engine,
@@ -4,6 +4,8 @@ from mindsdb_sql.utils import indent
 
 
 class CreatePredictor(ASTNode):
+    __slots__ = ('name', 'integration_name', 'query', 'datasource_name', 'targets', 'order_by', 'group_by', 'window', 'horizon', 'using')
+
     def __init__(self,
                  name,
                  integration_name,
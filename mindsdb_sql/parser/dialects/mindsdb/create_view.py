@@ -3,6 +3,8 @@ from mindsdb_sql.utils import indent
 
 
 class CreateView(ASTNode):
+    __slots__ = ('name', 'query', 'from_table')
+
     def __init__(self,
                  name,
                  query,
@@ -4,6 +4,8 @@ from mindsdb_sql.utils import indent
 
 
 class DropPredictor(ASTNode):
+    __slots__ = ('name',)
+
     def __init__(self,
                  name,
                  *args, **kwargs):
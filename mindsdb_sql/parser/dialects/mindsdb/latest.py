@@ -3,6 +3,8 @@ from mindsdb_sql.utils import indent
 
 
 class Latest(ASTNode):
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, alias=None, parentheses=False, **kwargs)
 
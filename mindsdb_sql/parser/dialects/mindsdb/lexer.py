@@ -51,98 +51,47 @@ class MindsDBLexer(Lexer):
         # Data types
         CAST, ID, INTEGER, FLOAT, STRING, NULL, TRUE, FALSE}
 
-    RETRAIN = r'\bRETRAIN\b'
-    # Custom commands
-
-    USE = r'\bUSE\b'
-    ENGINE = r'\bENGINE\b'
-    TRAIN = r'\bTRAIN\b'
-    TEST = r'\bTEST\b'
-    PREDICT = r'\bPREDICT\b'
-    MODEL = r'\bMODEL\b'
-    DROP = r'\bDROP\b'
-    PARAMETERS = r'\bPARAMETERS\b'
-    HORIZON = r'\bHORIZON\b'
-    USING = r'\bUSING\b'
-    VIEW = r'\bVIEW\b'
-    VIEWS = r'\bVIEWS\b'
-    STREAM = r'\bSTREAM\b'
-    STREAMS = r'\bSTREAMS\b'
-    PREDICTOR = r'\bPREDICTOR\b'
-    PREDICTORS = r'\bPREDICTORS\b'
-    DATASOURCE = r'\bDATASOURCE\b'
-    INTEGRATION = r'\bINTEGRATION\b'
-    INTEGRATIONS = r'\bINTEGRATIONS\b'
-    PUBLICATION = r'\bPUBLICATION\b'
-    PUBLICATIONS = r'\bPUBLICATIONS\b'
-    LATEST = r'\bLATEST\b'
-
-    # Misc
-    SET = r'\bSET\b'
-    AUTOCOMMIT = r'\bAUTOCOMMIT\b'
-    START = r'\bSTART\b'
-    TRANSACTION = r'\bTRANSACTION\b'
-    COMMIT = r'\bCOMMIT\b'
-    ROLLBACK = r'\bROLLBACK\b'
-    EXPLAIN = r'\bEXPLAIN\b'
-    ALTER = r'\bALTER\b'
-
-    DESCRIBE = r'\bDESCRIBE\b'
-
-    # SHOW
-    SHOW = r'\bSHOW\b'
-    SCHEMAS = r'\bSCHEMAS\b'
-    DATABASES = r'\bDATABASES\b'
-    TABLES = r'\bTABLES\b'
-    TABLE = r'\bTABLE\b'
-    FULL = r'\bFULL\b'
-    VARIABLES = r'\bVARIABLES\b'
-    SESSION = r'\bSESSION\b'
-    STATUS = r'\STATUS\b'
-    GLOBAL = r'\bGLOBAL\b'
-    PROCEDURE = r'\bPROCEDURE\b'
-    FUNCTION = r'\bFUNCTION\b'
-    INDEX = r'\bINDEX\b'
-    CREATE = r'\bCREATE\b'
-    WARNINGS = r'\bWARNINGS\b'
-    ENGINES = r'\bENGINES\b'
-    CHARSET = r'\bCHARSET\b'
-    CHARACTER = r'\bCHARACTER\b'
-    COLLATION = r'\bCOLLATION\b'
-    PLUGINS = r'\bPLUGINS\b'
-
-
-    # SELECT
-
-    ON = r'\bON\b'
-    ASC = r'\bASC\b'
-    DESC = r'\bDESC\b'
+    # Single-word keywords are matched by the ID rule and resolved with a single set lookup,
+    # instead of trying a separate regex for every keyword
+    keywords = {
+        # Custom commands
+        'USE', 'DROP', 'CREATE', 'DESCRIBE', 'RETRAIN',
+
+        # Mindsdb special
+        'PREDICTOR', 'PREDICTORS', 'DATASOURCE', 'INTEGRATION', 'INTEGRATIONS',
+        'STREAM', 'STREAMS', 'PUBLICATION', 'PUBLICATIONS', 'VIEW', 'VIEWS',
+        'LATEST', 'HORIZON', 'USING',
+        'ENGINE', 'TRAIN', 'TEST', 'PREDICT', 'MODEL', 'PARAMETERS',
+
+        # Misc
+        'SET', 'AUTOCOMMIT', 'START', 'TRANSACTION', 'COMMIT', 'ROLLBACK', 'EXPLAIN', 'ALTER',
+
+        # SHOW
+        'SHOW', 'SCHEMAS', 'DATABASES', 'TABLES', 'TABLE', 'FULL', 'VARIABLES', 'SESSION', 'STATUS',
+        'GLOBAL', 'PROCEDURE', 'FUNCTION', 'INDEX', 'WARNINGS', 'ENGINES', 'CHARSET',
+        'CHARACTER', 'COLLATION', 'PLUGINS',
+
+        # SELECT
+        'ON', 'ASC', 'DESC', 'WITH', 'SELECT', 'DISTINCT', 'FROM', 'AS', 'WHERE', 'LIMIT', 'OFFSET',
+        'HAVING', 'JOIN', 'INNER', 'OUTER', 'CROSS', 'LEFT', 'RIGHT',
+
+        # UNION
+        'UNION', 'ALL',
+
+        # Operators
+        'AND', 'OR', 'NOT', 'IS', 'LIKE', 'IN', 'CAST', 'BETWEEN', 'WINDOW',
+
+        # Data types
+        'NULL', 'TRUE', 'FALSE',
+    }
+
+    # Multi-word keywords
     NULLS_FIRST = r'\bNULLS FIRST\b'
     NULLS_LAST = r'\bNULLS LAST\b'
-    WITH = r'\bWITH\b'
-    SELECT = r'\bSELECT\b'
-    DISTINCT = r'\bDISTINCT\b'
-    FROM = r'\bFROM\b'
-    AS = r'\bAS\b'
-    WHERE = r'\bWHERE\b'
-    LIMIT = r'\bLIMIT\b'
-    OFFSET = r'\bOFFSET\b'
     GROUP_BY = r'\bGROUP BY\b'
-    HAVING = r'\bHAVING\b'
     ORDER_BY = r'\bORDER BY\b'
-    STAR = r'\*'
 
-    JOIN = r'\bJOIN\b'
-    INNER = r'\bINNER\b'
-    OUTER = r'\bOUTER\b'
-    CROSS = r'\bCROSS\b'
-    LEFT = r'\bLEFT\b'
-    RIGHT = r'\bRIGHT\b'
-
-    # UNION
-
-    UNION = r'\bUNION\b'
-    ALL = r'\bALL\b'
+    STAR = r'\*'
 
     # Special
     DOT = r'\.'
@@ -162,24 +111,13 @@ class MindsDBLexer(Lexer):
     GREATER = r'>'
     LEQ = r'<='
     LESS = r'<'
-    AND = r'\bAND\b'
-    OR = r'\bOR\b'
-    NOT = r'\bNOT\b'
-    IS = r'\bIS\b'
-    LIKE = r'\bLIKE\b'
-    IN = r'\bIN\b'
-    CAST = r'\bCAST\b'
     CONCAT = r'\|\|'
-    BETWEEN = r'\bBETWEEN\b'
-    WINDOW = r'\bWINDOW\b'
-
-    # Data types
-    NULL = r'\bNULL\b'
-    TRUE = r'\bTRUE\b'
-    FALSE = r'\bFALSE\b'
 
     @_(r'([a-zA-Z_][a-zA-Z_0-9]*|`([^`]+)`)|([a-zA-Z_][a-zA-Z_.0-9]*|`([^`]+)`)')
     def ID(self, t):
+        keyword = t.value.upper()
+        if keyword in self.keywords:
+            t.type = keyword
         return t
 
     @_(r'\d+\.\d+')
@@ -1,3 +1,13 @@
-from .lexer import MySQLLexer
-from .parser import MySQLParser
-from .variable import Variable
\ No newline at end of file
+from mindsdb_sql.utils import lazy_module_getattr
+
+# Submodules are imported on first attribute access (PEP 562), so importing a node
+# such as Variable does not build the dialect parser tables
+_MODULES = {
+    'MySQLLexer': 'lexer',
+    'MySQLParser': 'parser',
+    'Variable': 'variable',
+}
+
+__all__ = list(_MODULES)
+
+__getattr__, __dir__ = lazy_module_getattr(__name__, _MODULES)
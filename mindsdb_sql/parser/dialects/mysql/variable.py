@@ -3,6 +3,8 @@ from mindsdb_sql.utils import indent
 
 
 class Variable(ASTNode):
+    __slots__ = ('value', 'is_system_var')
+
     def __init__(self, value, is_system_var=False, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.value = value
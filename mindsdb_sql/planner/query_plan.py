@@ -23,7 +23,7 @@ from mindsdb_sql.utils import JoinType
 class QueryPlan:
     def __init__(self,
                  integrations=None,
-                 predictor_namespace=None,
+                 predictor_namespace='mindsdb',
                  predictor_metadata=None,
                  steps=None,
                  default_namespace=None):
@@ -49,7 +49,7 @@ class QueryPlan:
             if step != other_step:
                 return False
 
-        if self.result_refs != other.result_refs:
+        if self.default_namespace != other.default_namespace:
             return False
         return True
 
@@ -308,9 +308,6 @@ class QueryPlan:
         return final_step
 
     def plan_join_two_tables(self, join):
-        select_left_step = self.plan_integration_select(Select(targets=[Star()], from_table=join.left))
-        select_right_step = self.plan_integration_select(Select(targets=[Star()], from_table=join.right))
-
         left_integration_name, left_table = self.get_integration_path_from_identifier_or_error(join.left)
         right_integration_name, right_table = self.get_integration_path_from_identifier_or_error(join.right)
 
@@ -331,7 +328,14 @@ class QueryPlan:
                         f'Wrong table or no source table in join condition for column: {str(arg)}')
             else:
                 new_condition_args.append(arg)
-        new_join = copy.deepcopy(join)
+
+        # Fetch steps are added only once the join condition is known to be valid
+        select_left_step = self.plan_integration_select(Select(targets=[Star()], from_table=join.left))
+        select_right_step = self.plan_integration_select(Select(targets=[Star()], from_table=join.right))
+
+        # The replaced fields are rebuilt, so shallow copies are enough to leave the input join untouched
+        new_join = copy.copy(join)
+        new_join.condition = copy.copy(join.condition)
         new_join.condition.args = new_condition_args
         new_join.left = Identifier(left_table_path, alias=left_table.alias)
         new_join.right = Identifier(right_table_path, alias=right_table.alias)
@@ -1,10 +1,12 @@
 class Result:
     """A placeholder for cached results of some previous plan step"""
+    __slots__ = ('step_num',)
+
     def __init__(self, step_num):
         self.step_num = step_num
 
     def __hash__(self):
-        return 'Result' + self.step_num.__hash__()
+        return hash(('Result', self.step_num))
 
     def __eq__(self, other):
         if isinstance(other, Result):
@@ -1,8 +1,11 @@
 from mindsdb_sql.exceptions import PlanningException
 from mindsdb_sql.planner.step_result import Result
+from mindsdb_sql.utils import get_slot_fields
 
 
 class PlanStep:
+    __slots__ = ('step_num', 'references')
+
     def __init__(self, step_num=None, references=None):
         self.step_num = step_num
         self.references = references or []
@@ -17,20 +20,21 @@ class PlanStep:
         if type(self) != type(other):
             return False
 
-        for k in vars(self):
+        for k in get_slot_fields(type(self)):
             if getattr(self, k) != getattr(other, k):
                 return False
 
         return True
 
     def __repr__(self):
-        attrs_dict = vars(self)
-        attrs_str = ', '.join([f'{k}={str(v)}' for k, v in attrs_dict.items()])
+        attrs_str = ', '.join([f'{k}={str(getattr(self, k))}' for k in get_slot_fields(type(self))])
         return f'{self.__class__.__name__}({attrs_str})'
 
 
 class ProjectStep(PlanStep):
     """Selects columns from a dataframe"""
+    __slots__ = ('columns', 'dataframe')
+
     def __init__(self, columns, dataframe, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.columns = columns
@@ -42,6 +46,8 @@ class ProjectStep(PlanStep):
 
 class FilterStep(PlanStep):
     """Filters some dataframe according to a query"""
+    __slots__ = ('dataframe', 'query')
+
     def __init__(self, dataframe, query, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.dataframe = dataframe
@@ -53,6 +59,7 @@ class FilterStep(PlanStep):
 
 class GroupByStep(PlanStep):
     """Groups output by columns and computes aggregation functions"""
+    __slots__ = ('dataframe', 'columns', 'targets')
 
     def __init__(self, dataframe, columns, targets, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -66,6 +73,8 @@ class GroupByStep(PlanStep):
 
 class JoinStep(PlanStep):
     """Joins two dataframes, producing a new dataframe"""
+    __slots__ = ('left', 'right', 'query')
+
     def __init__(self, left, right, query, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.left = left
@@ -81,6 +90,8 @@ class JoinStep(PlanStep):
 
 class UnionStep(PlanStep):
     """Union of two dataframes, producing a new dataframe"""
+    __slots__ = ('left', 'right', 'unique')
+
     def __init__(self, left, right, unique, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.left = left
@@ -96,6 +107,7 @@ class UnionStep(PlanStep):
 
 class OrderByStep(PlanStep):
     """Applies sorting to a dataframe"""
+    __slots__ = ('dataframe', 'order_by')
 
     def __init__(self, dataframe, order_by, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -108,6 +120,8 @@ class OrderByStep(PlanStep):
 
 class LimitOffsetStep(PlanStep):
     """Applies limit and offset to a dataframe"""
+    __slots__ = ('dataframe', 'limit', 'offset')
+
     def __init__(self, dataframe, limit=None, offset=None, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.dataframe = dataframe
@@ -120,6 +134,8 @@ class LimitOffsetStep(PlanStep):
 
 class FetchDataframeStep(PlanStep):
     """Fetches a dataframe from external integration"""
+    __slots__ = ('integration', 'query')
+
     def __init__(self, integration, query, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.integration = integration
@@ -128,6 +144,8 @@ class FetchDataframeStep(PlanStep):
 
 class ApplyPredictorStep(PlanStep):
     """Applies a mindsdb predictor on some dataframe and returns a new dataframe with predictions"""
+    __slots__ = ('namespace', 'predictor', 'dataframe')
+
     def __init__(self, namespace, predictor, dataframe,  *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.namespace = namespace
@@ -142,6 +160,7 @@ class ApplyTimeseriesPredictorStep(ApplyPredictorStep):
     """Applies a mindsdb predictor on some dataframe and returns a new dataframe with predictions.
     Accepts an additional parameter output_time_filter that specifies for which dates the predictions should be returned
     """
+    __slots__ = ('output_time_filter',)
 
     def __init__(self, *args, output_time_filter=None, **kwargs):
         super().__init__(*args, **kwargs)
@@ -150,6 +169,8 @@ class ApplyTimeseriesPredictorStep(ApplyPredictorStep):
 
 class ApplyPredictorRowStep(PlanStep):
     """Applies a mindsdb predictor to one row of values and returns a dataframe of one row, the predictor."""
+    __slots__ = ('namespace', 'predictor', 'row_dict')
+
     def __init__(self, namespace, predictor, row_dict, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.namespace = namespace
@@ -159,6 +180,8 @@ class ApplyPredictorRowStep(PlanStep):
 
 class GetPredictorColumns(PlanStep):
     """Returns an empty dataframe of shape and columns like predictor results."""
+    __slots__ = ('namespace', 'predictor')
+
     def __init__(self, namespace, predictor, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.namespace = namespace
@@ -167,6 +190,8 @@ class GetPredictorColumns(PlanStep):
 
 class MapReduceStep(PlanStep):
     """Applies a step for each value in a list, and then reduces results to a single dataframe"""
+    __slots__ = ('values', 'step', 'reduce')
+
     def __init__(self, values, step, reduce, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.values = values
@@ -178,6 +203,8 @@ class MapReduceStep(PlanStep):
 
 
 class MultipleSteps(PlanStep):
+    __slots__ = ('steps', 'reduce')
+
     def __init__(self, steps, reduce, *args, **kwargs):
         """Runs multiple steps and reduces results to a single dataframe"""
         super().__init__(*args, **kwargs)
@@ -1,10 +1,42 @@
+import importlib
+import sys
+from functools import lru_cache
+
 from mindsdb_sql.exceptions import ParsingException
 
 
+@lru_cache(maxsize=64)
 def indent(level):
     return '  ' * level
 
 
+@lru_cache(maxsize=None)
+def get_slot_fields(cls):
+    """Names of all slots declared along the class hierarchy, in declaration order"""
+    fields = []
+    for klass in reversed(cls.__mro__):
+        slots = vars(klass).get('__slots__', ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        fields.extend(slots)
+    return tuple(fields)
+
+
+def lazy_module_getattr(package, names_to_modules):
+    """Module level __getattr__ and __dir__ (PEP 562) that import a package's submodules on first attribute access"""
+    def __getattr__(name):
+        if name not in names_to_modules:
+            raise AttributeError(f'module {package!r} has no attribute {name!r}')
+        value = getattr(importlib.import_module(f'.{names_to_modules[name]}', package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[package])) | set(names_to_modules))
+
+    return __getattr__, __dir__
+
+
 def ensure_select_keyword_order(select, operation):
     op_to_attr = {
         'FROM': select.from_table,
@@ -0,0 +1,12 @@
+import pytest
+
+from mindsdb_sql import get_lexer_parser
+
+DIALECTS = ['sqlite', 'mysql', 'mindsdb']
+
+
+@pytest.fixture(scope='module', params=DIALECTS)
+def dialect(request):
+    # Tests run grouped by dialect, the parser is built once before the first test of each group
+    get_lexer_parser(request.param)
+    return request.param
@@ -50,6 +50,17 @@ class TestLexer:
         assert tokens[1].type == 'ID'
         assert tokens[1].value == 'a'
 
+    def test_keyword_like_identifiers(self, lexer):
+        sql = 'SeLeCt selection, from_date, `from` FrOm tables_list'
+        tokens = list(lexer.tokenize(sql))
+
+        assert [t.type for t in tokens] == ['SELECT', 'ID', 'COMMA', 'ID', 'COMMA', 'ID', 'FROM', 'ID']
+        assert tokens[0].value == 'SeLeCt'
+        assert tokens[1].value == 'selection'
+        assert tokens[3].value == 'from_date'
+        assert tokens[5].value == '`from`'
+        assert tokens[7].value == 'tables_list'
+
     def test_select_identifiers(self, lexer):
         sql = 'SELECT abcd123, __whatisthi123s__, `spaces in id`'
         tokens = list(lexer.tokenize(sql))
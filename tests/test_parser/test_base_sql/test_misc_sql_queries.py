@@ -1,15 +1,27 @@
-import itertools
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
-from mindsdb_sql import parse_sql, get_lexer_parser
-from mindsdb_sql.parser.ast import *
-from mindsdb_sql.exceptions import ParsingException
-from mindsdb_sql.utils import JoinType
+from mindsdb_sql.parser import ast as ast_package
+from mindsdb_sql import parse_sql, parse_tokens, get_lexer_parser
+from mindsdb_sql.parser.ast import (Set, Identifier, Constant, NullConstant, BinaryOperation, StartTransaction,
+                                    RollbackTransaction, CommitTransaction, Explain, AlterTable, Select, OrderBy)
+
+
+@pytest.fixture
+def lexer_parser(dialect):
+    # get_lexer_parser keeps one lexer/parser pair per dialect and thread
+    return get_lexer_parser(dialect)
+
+
+def check_parse(sql, expected_ast, dialect):
+    ast = parse_sql(sql, dialect=dialect)
+    assert ast == expected_ast
+    assert str(ast) == str(expected_ast)
 
 
-@pytest.mark.parametrize('dialect', ['sqlite', 'mysql', 'mindsdb'])
 class TestMiscQueries:
-    def test_set(self, dialect):
-        lexer, parser = get_lexer_parser(dialect)
+    def test_set_tokens(self, dialect, lexer_parser):
+        lexer, parser = lexer_parser
 
         sql = "set autocommit"
 
@@ -19,70 +31,95 @@ class TestMiscQueries:
         assert tokens[0].type == 'SET'
         assert tokens[1].type == 'AUTOCOMMIT'
 
-        ast = parse_sql(sql, dialect=dialect)
-        expected_ast = Set(category="autocommit")
-        assert ast.to_tree() == expected_ast.to_tree()
-        assert str(ast) == str(expected_ast)
-
-        sql = "SET NAMES some_name"
-
-        ast = parse_sql(sql, dialect=dialect)
-        expected_ast = Set(category="names", arg=Identifier('some_name'))
-        assert ast.to_tree() == expected_ast.to_tree()
-        assert str(ast) == str(expected_ast)
-
-        sql = "set character_set_results = NULL"
+        ast = parse_tokens(tokens, dialect=dialect)
+        assert ast == Set(category="autocommit")
 
-        ast = parse_sql(sql, dialect=dialect)
-        expected_ast = Set(arg=BinaryOperation('=', args=[Identifier('character_set_results'), NullConstant()]))
-        assert ast.to_tree() == expected_ast.to_tree()
-        assert str(ast) == str(expected_ast)
+    @pytest.mark.parametrize('sql, expected_ast', [
+        ("set autocommit", Set(category="autocommit")),
+        ("SET NAMES some_name", Set(category="names", arg=Identifier('some_name'))),
+        ("set character_set_results = NULL",
+         Set(arg=BinaryOperation('=', args=[Identifier('character_set_results'), NullConstant()]))),
+    ])
+    def test_set(self, dialect, sql, expected_ast):
+        check_parse(sql, expected_ast, dialect)
 
     def test_start_transaction(self, dialect):
-        sql = "start transaction"
-
-        ast = parse_sql(sql, dialect=dialect)
-        expected_ast = StartTransaction()
-        assert ast.to_tree() == expected_ast.to_tree()
-        assert str(ast) == str(expected_ast)
+        check_parse("start transaction", StartTransaction(), dialect)
 
     def test_rollback(self, dialect):
-        sql = "rollback"
-
-        ast = parse_sql(sql, dialect=dialect)
-        expected_ast = RollbackTransaction()
-        assert ast.to_tree() == expected_ast.to_tree()
-        assert str(ast) == str(expected_ast)
+        check_parse("rollback", RollbackTransaction(), dialect)
 
     def test_commit(self, dialect):
-        sql = "commit"
-
-        ast = parse_sql(sql, dialect=dialect)
-        expected_ast = CommitTransaction()
-        assert ast.to_tree() == expected_ast.to_tree()
-        assert str(ast) == str(expected_ast)
+        check_parse("commit", CommitTransaction(), dialect)
 
     def test_explain(self, dialect):
+        check_parse("explain some_table", Explain(target=Identifier('some_table')), dialect)
+
+    @pytest.mark.parametrize('sql, expected_ast', [
+        ("alter table some_table disable keys", AlterTable(target=Identifier('some_table'), arg='disable keys')),
+        ("alter table some_table enable keys", AlterTable(target=Identifier('some_table'), arg='enable keys')),
+    ])
+    def test_alter_table_keys(self, dialect, sql, expected_ast):
+        check_parse(sql, expected_ast, dialect)
+
+    def test_ast_equality(self, dialect):
+        ast = parse_sql("set character_set_results = 1", dialect=dialect)
+
+        assert ast == Set(arg=BinaryOperation('=', args=[Identifier('character_set_results'), Constant(1)]))
+        assert ast != Set(arg=BinaryOperation('=', args=[Identifier('character_set_results'), Constant(1.0)]))
+        assert ast != Set(arg=BinaryOperation('=', args=[Identifier('character_set_results'), Constant(True)]))
+        assert ast != Set(arg=BinaryOperation('!=', args=[Identifier('character_set_results'), Constant(1)]))
+        assert ast != Set(arg=BinaryOperation('=', args=[Identifier('character_set'), Constant(1)]))
+
+    def test_ast_package_names(self, dialect):
+        # select nodes are loaded lazily but stay listed for completion and star imports
+        for name in ast_package.__all__:
+            assert name in dir(ast_package)
+            assert getattr(ast_package, name).__name__ == name
+
+    def test_parse_sql_cache_returns_copies(self, dialect):
         sql = "explain some_table"
 
         ast = parse_sql(sql, dialect=dialect)
-        expected_ast = Explain(target=Identifier('some_table'))
-        assert ast.to_tree() == expected_ast.to_tree()
-        assert str(ast) == str(expected_ast)
+        ast.target.parts = ['other_table']
 
-    def test_alter_table_keys(self, dialect):
-        sql = "alter table some_table disable keys"
+        assert parse_sql(sql, dialect=dialect) == Explain(target=Identifier('some_table'))
+        assert parse_sql(f' {sql}\n', dialect=dialect) == Explain(target=Identifier('some_table'))
 
-        ast = parse_sql(sql, dialect=dialect)
-        expected_ast = AlterTable(target=Identifier('some_table'), arg='disable keys')
-        assert ast.to_tree() == expected_ast.to_tree()
-        assert str(ast) == str(expected_ast)
+    def test_lexer_parser_reused(self, dialect, lexer_parser):
+        assert get_lexer_parser(dialect) is lexer_parser
 
-        sql = "alter table some_table enable keys"
+    def test_lexer_parser_per_thread(self, dialect, lexer_parser):
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            other_thread_lexer_parser = executor.submit(get_lexer_parser, dialect).result()
 
-        ast = parse_sql(sql, dialect=dialect)
-        expected_ast = AlterTable(target=Identifier('some_table'), arg='enable keys')
-        assert ast.to_tree() == expected_ast.to_tree()
-        assert str(ast) == str(expected_ast)
+        assert other_thread_lexer_parser[0] is not lexer_parser[0]
+        assert other_thread_lexer_parser[1] is not lexer_parser[1]
+
+    def test_parse_sql_concurrent_threads(self, dialect):
+        # Distinct queries, so every call misses the AST cache and runs the lexer and parser
+        queries = range(400)
+
+        def parse(i):
+            return parse_sql(f"select a{i}, b from t{i} where c{i} = {i} order by a{i} limit {i}", dialect=dialect)
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            asts = list(executor.map(parse, queries))
+
+        assert asts == [Select(targets=[Identifier(f'a{i}'), Identifier('b')],
+                               from_table=Identifier(f't{i}'),
+                               where=BinaryOperation('=', args=[Identifier(f'c{i}'), Constant(i)]),
+                               order_by=[OrderBy(Identifier(f'a{i}'))],
+                               limit=Constant(i))
+                        for i in queries]
 
+    @pytest.mark.parametrize('sql', [
+        "set autocommit",
+        "select a, b from t1 where c = 1 order by a limit 10",
+        "explain some_table",
+    ])
+    def test_parse_tokens(self, dialect, lexer_parser, sql):
+        lexer, parser = lexer_parser
 
+        assert parse_tokens(lexer.tokenize(sql), dialect=dialect) == parse_sql(sql, dialect=dialect)
+        assert parse_tokens(list(lexer.tokenize(sql)), dialect=dialect) == parse_sql(sql, dialect=dialect)
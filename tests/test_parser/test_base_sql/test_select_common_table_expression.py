@@ -1,12 +1,9 @@
-import itertools
-import pytest
 from mindsdb_sql import parse_sql
 from mindsdb_sql.parser.ast import *
 from mindsdb_sql.exceptions import ParsingException
 from mindsdb_sql.utils import JoinType
 
 
-@pytest.mark.parametrize('dialect', ['sqlite', 'mysql', 'mindsdb'])
 class TestCommonTableExpression:
 
     def test_cte_select_number(self, dialect):
@@ -23,7 +20,7 @@ class TestCommonTableExpression:
 
         assert str(ast).lower() == sql.lower()
         assert str(ast) == str(expected_ast)
-        assert ast.to_tree() == expected_ast.to_tree()
+        assert ast == expected_ast
 
     def test_cte_select_named_columns(self, dialect):
         sql = f'WITH cte( a, b ) AS ( SELECT 1, 2 ) SELECT a, b FROM cte'
@@ -41,7 +38,7 @@ class TestCommonTableExpression:
 
         assert str(ast).lower() == sql.lower()
         assert str(ast) == str(expected_ast)
-        assert ast.to_tree() == expected_ast.to_tree()
+        assert ast == expected_ast
 
     def test_cte_multiple(self, dialect):
         sql = '''WITH cte_a AS ( SELECT 1 ), cte_b AS ( SELECT 2 ) SELECT * FROM cte_a, cte_b'''
@@ -63,7 +60,7 @@ class TestCommonTableExpression:
 
         assert str(ast).lower() == sql.lower()
         assert str(ast) == str(expected_ast)
-        assert ast.to_tree() == expected_ast.to_tree()
+        assert ast == expected_ast
 
     def test_cte_nested(self, dialect):
         sql = '''WITH cte AS ( SELECT 1 ) SELECT * FROM (WITH cte_1 AS ( SELECT 2 ) SELECT * FROM cte_1 JOIN cte) AS subquery'''
@@ -90,4 +87,4 @@ class TestCommonTableExpression:
 
         assert str(ast).lower() == sql.lower()
         assert str(ast) == str(expected_ast)
-        assert ast.to_tree() == expected_ast.to_tree()
+        assert ast == expected_ast
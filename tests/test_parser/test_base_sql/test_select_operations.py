@@ -1,12 +1,9 @@
-import pytest
-
 from mindsdb_sql import parse_sql
 from mindsdb_sql.parser.ast import Identifier, Constant, Select, BinaryOperation, UnaryOperation, NullConstant
 from mindsdb_sql.parser.ast import Function, BetweenOperation
 from mindsdb_sql.parser.ast import Tuple
 
 
-@pytest.mark.parametrize('dialect', ['sqlite', 'mysql', 'mindsdb'])
 class TestOperations:
     def test_select_binary_operations(self, dialect):
         for op in ['+', '-', '/', '*', '%', '=', '!=', '>', '<', '>=', '<=',
@@ -25,7 +22,7 @@ class TestOperations:
 
             assert str(ast).lower() == sql.lower()
             assert str(ast) == str(expected_ast)
-            assert ast.to_tree() == expected_ast.to_tree()
+            assert ast == expected_ast
 
     def test_operation_converts_to_lowercase(self, dialect):
         sql = f'SELECT column1 IS column2 FROM tab'
@@ -41,7 +38,7 @@ class TestOperations:
         )
 
         assert str(ast) == str(expected_ast)
-        assert ast.to_tree() == expected_ast.to_tree()
+        assert ast == expected_ast
 
     def test_operator_precedence_sum_mult(self, dialect):
         sql = f'SELECT column1 + column2 * column3'
@@ -63,7 +60,7 @@ class TestOperations:
 
         assert str(ast).lower() == sql.lower()
         assert str(ast) == str(expected_ast)
-        assert ast.to_tree() == expected_ast.to_tree()
+        assert ast == expected_ast
 
         sql = f'SELECT column1 * column2 + column3'
         ast = parse_sql(sql, dialect=dialect)
@@ -84,7 +81,6 @@ class TestOperations:
 
         assert str(ast).lower() == sql.lower()
         assert ast == expected_ast
-        assert ast.to_tree() == expected_ast.to_tree()
 
 
     def test_operator_precedence_sum_mult_parentheses(self, dialect):
@@ -108,7 +104,7 @@ class TestOperations:
 
         assert str(ast).lower() == sql.lower()
         assert str(ast) == str(expected_ast)
-        assert ast.to_tree() == expected_ast.to_tree()
+        assert ast == expected_ast
 
     def test_operator_chained_and(self, dialect):
         sql = f"""SELECT column1 AND column2 AND column3"""
@@ -122,7 +118,7 @@ class TestOperations:
                                                                        ))])
 
         assert str(ast).lower() == sql.lower()
-        assert ast.to_tree() == expected_ast.to_tree()
+        assert ast == expected_ast
 
     def test_operator_precedence_or_and(self, dialect):
         sql = f'SELECT column1 OR column2 AND column3'
@@ -143,7 +139,6 @@ class TestOperations:
 
         assert str(ast).lower() == sql.lower()
         assert ast == expected_ast
-        assert ast.to_tree() == expected_ast.to_tree()
 
         sql = f'SELECT column1 AND column2 OR column3'
         ast = parse_sql(sql, dialect=dialect)
@@ -164,7 +159,6 @@ class TestOperations:
 
         assert str(ast).lower() == sql.lower()
         assert ast == expected_ast
-        assert ast.to_tree() == expected_ast.to_tree()
 
     def test_operator_precedence_or_and_parentheses(self, dialect):
         sql = f'SELECT (column1 OR column2) AND column3'
@@ -187,7 +181,7 @@ class TestOperations:
 
         assert str(ast).lower() == sql.lower()
         assert str(ast) == str(expected_ast)
-        assert ast.to_tree() == expected_ast.to_tree()
+        assert ast == expected_ast
 
     def test_where_and_or_precedence(self, dialect):
         sql = "SELECT col1 FROM tab WHERE col1 AND col2 OR col3"
@@ -210,7 +204,7 @@ class TestOperations:
 
         assert str(ast).lower() == sql.lower()
         assert str(ast) == str(expected_ast)
-        assert ast.to_tree() == expected_ast.to_tree()
+        assert ast == expected_ast
 
         sql = "SELECT col1 FROM tab WHERE col1 = 1 AND col2 = 1 OR col3 = 1"
         ast = parse_sql(sql, dialect=dialect)
@@ -244,7 +238,7 @@ class TestOperations:
 
         assert str(ast).lower() == sql.lower()
         assert str(ast) == str(expected_ast)
-        assert ast.to_tree() == expected_ast.to_tree()
+        assert ast == expected_ast
 
     def test_select_unary_operations(self, dialect):
         for op in ['-', 'not']:
@@ -272,7 +266,7 @@ class TestOperations:
 
         assert str(ast).lower() == sql.lower()
         assert str(ast) == str(expected_ast)
-        assert ast.to_tree() == expected_ast.to_tree()
+        assert ast == expected_ast
 
     def test_select_function_one_arg(self, dialect):
         funcs = ['sum', 'min', 'max', 'some_custom_function']
@@ -287,7 +281,7 @@ class TestOperations:
 
             assert str(ast).lower() == sql.lower()
             assert str(ast) == str(expected_ast)
-            assert ast.to_tree() == expected_ast.to_tree()
+            assert ast == expected_ast
 
     def test_select_function_two_args(self, dialect):
         funcs = ['sum', 'min', 'max', 'some_custom_function']
@@ -302,7 +296,7 @@ class TestOperations:
 
             assert str(ast).lower() == sql.lower()
             assert str(ast) == str(expected_ast)
-            assert ast.to_tree() == expected_ast.to_tree()
+            assert ast == expected_ast
 
     def test_select_in_operation(self, dialect):
         sql = """SELECT * FROM t1 WHERE col1 IN ("a", "b")"""
@@ -321,7 +315,6 @@ class TestOperations:
         print(expected_where.to_tree())
         print(ast.where)
         print(expected_where)
-        assert ast.where.to_tree() == expected_where.to_tree()
         assert ast.where == expected_where
 
     def test_unary_is_special_values(self, dialect):
@@ -333,7 +326,7 @@ class TestOperations:
             expected_ast = Select(targets=[BinaryOperation(op='IS', args=(Identifier.from_path_str("column1"), python_obj))], )
 
             assert str(ast).lower() == sql.lower()
-            assert ast.to_tree() == expected_ast.to_tree()
+            assert ast == expected_ast
 
     def test_unary_is_not_special_values(self, dialect):
         args = [('NULL', NullConstant()), ('TRUE', Constant(value=True)), ('FALSE', Constant(value=False))]
@@ -344,7 +337,7 @@ class TestOperations:
             expected_ast = Select(targets=[BinaryOperation(op='IS NOT', args=(Identifier.from_path_str("column1"), python_obj))], )
 
             assert str(ast).lower() == sql.lower()
-            assert ast.to_tree() == expected_ast.to_tree()
+            assert ast == expected_ast
             assert str(ast) == str(expected_ast)
 
     def test_not_in(self, dialect):
@@ -353,7 +346,7 @@ class TestOperations:
 
         expected_ast = Select(targets=[BinaryOperation(op='not in', args=(Identifier.from_path_str("column1"), Identifier.from_path_str("column2")))], )
 
-        assert ast.to_tree() == expected_ast.to_tree()
+        assert ast == expected_ast
         assert str(ast) == str(expected_ast)
 
     def test_is_null(self, dialect):
@@ -363,10 +356,10 @@ class TestOperations:
         expected_ast = Select(targets=[Identifier.from_path_str("col1")], from_table=Identifier.from_path_str('t1'),
                               where=BinaryOperation('is', args=(Identifier.from_path_str('col1'), NullConstant())))
 
-        assert ast.to_tree() == expected_ast.to_tree()
+        assert ast == expected_ast
 
         assert str(ast).lower() == sql.lower()
-        assert ast.to_tree() == expected_ast.to_tree()
+        assert ast == expected_ast
         assert str(ast) == str(expected_ast)
 
     def test_is_not_null(self, dialect):
@@ -375,10 +368,10 @@ class TestOperations:
 
         expected_ast = Select(targets=[Identifier.from_path_str("col1")], from_table=Identifier.from_path_str('t1'),
                               where=BinaryOperation('IS NOT', args=(Identifier.from_path_str('col1'), NullConstant())))
-        assert ast.to_tree() == expected_ast.to_tree()
+        assert ast == expected_ast
 
         assert str(ast).lower() == sql.lower()
-        assert ast.to_tree() == expected_ast.to_tree()
+        assert ast == expected_ast
         assert str(ast) == str(expected_ast)
 
     def test_is_true(self, dialect):
@@ -387,10 +380,10 @@ class TestOperations:
 
         expected_ast = Select(targets=[Identifier.from_path_str("col1")], from_table=Identifier.from_path_str('t1'),
                               where=BinaryOperation('is', args=(Identifier.from_path_str('col1'), Constant(True))))
-        assert ast.to_tree() == expected_ast.to_tree()
+        assert ast == expected_ast
 
         assert str(ast).lower() == sql.lower()
-        assert ast.to_tree() == expected_ast.to_tree()
+        assert ast == expected_ast
         assert str(ast) == str(expected_ast)
 
     def test_is_false(self, dialect):
@@ -400,7 +393,7 @@ class TestOperations:
         expected_ast = Select(targets=[Identifier.from_path_str("col1")], from_table=Identifier.from_path_str('t1'),
                               where=BinaryOperation('is', args=(Identifier.from_path_str('col1'), Constant(False))))
         assert str(ast).lower() == sql.lower()
-        assert ast.to_tree() == expected_ast.to_tree()
+        assert ast == expected_ast
         assert str(ast) == str(expected_ast)
 
     def test_between(self, dialect):
@@ -411,7 +404,7 @@ class TestOperations:
                               where=BetweenOperation(args=(Identifier.from_path_str('col1'), Identifier.from_path_str('a'), Identifier.from_path_str('b'))))
 
         assert str(ast).lower() == sql.lower()
-        assert ast.to_tree() == expected_ast.to_tree()
+        assert ast == expected_ast
         assert str(ast) == str(expected_ast)
 
     def test_between_with_and(self, dialect):
@@ -431,7 +424,7 @@ class TestOperations:
                               ])
                               )
 
-        assert ast.to_tree() == expected_ast.to_tree()
+        assert ast == expected_ast
         assert str(ast).lower() == sql.lower()
         assert str(ast) == str(expected_ast)
 
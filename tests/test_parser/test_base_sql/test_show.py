@@ -5,7 +5,6 @@ from mindsdb_sql.parser.ast.show import Show
 from mindsdb_sql.parser.ast import *
 
 
-@pytest.mark.parametrize('dialect', ['sqlite', 'mysql', 'mindsdb'])
 class TestShow:
     def test_show_category(self, dialect):
         categories = ['SCHEMAS',
@@ -35,7 +34,7 @@ class TestShow:
 
             assert str(ast).lower() == sql.lower()
             assert str(ast) == str(expected_ast)
-            assert ast.to_tree() == expected_ast.to_tree()
+            assert ast == expected_ast
 
     def test_show_unknown_category_error(self, dialect):
         sql = "SHOW abracadabra"
@@ -55,7 +54,7 @@ class TestShow:
 
         assert str(ast).lower() == sql.lower()
         assert str(ast) == str(expected_ast)
-        assert ast.to_tree() == expected_ast.to_tree()
+        assert ast == expected_ast
 
     def test_show_function_status(self, dialect):
         sql = "show function status where Db = 'MINDSDB' AND Name LIKE '%'"
@@ -69,7 +68,7 @@ class TestShow:
 
         assert str(ast).lower() == sql.lower()
         assert str(ast) == str(expected_ast)
-        assert ast.to_tree() == expected_ast.to_tree()
+        assert ast == expected_ast
 
 
     def test_show_character_set(self, dialect):
@@ -81,4 +80,4 @@ class TestShow:
 
         assert str(ast).lower() == sql.lower()
         assert str(ast) == str(expected_ast)
-        assert ast.to_tree() == expected_ast.to_tree()
+        assert ast == expected_ast
@@ -1,4 +1,3 @@
-import itertools
 import pytest
 from mindsdb_sql import parse_sql
 from mindsdb_sql.parser.ast import *
@@ -6,7 +5,6 @@ from mindsdb_sql.exceptions import ParsingException
 from mindsdb_sql.utils import JoinType
 
 
-@pytest.mark.parametrize('dialect', ['sqlite', 'mysql', 'mindsdb'])
 class TestUnion:
     def test_single_select_error(self, dialect):
         sql = "SELECT col FROM tab UNION"
@@ -27,7 +25,7 @@ class TestUnion:
                                          from_table=Identifier(parts=['tab2']),
                                          ),
                              )
-        assert ast.to_tree() == expected_ast.to_tree()
+        assert ast == expected_ast
         assert str(ast) == str(expected_ast)
 
     def test_union_all(self, dialect):
@@ -44,7 +42,7 @@ class TestUnion:
                                          from_table=Identifier(parts=['tab2']),
                                          ),
                              )
-        assert ast.to_tree() == expected_ast.to_tree()
+        assert ast == expected_ast
         assert str(ast) == str(expected_ast)
 
     def test_union_alias(self, dialect):
@@ -67,6 +65,6 @@ class TestUnion:
                                                             ),
                                                )
                               )
-        assert ast.to_tree() == expected_ast.to_tree()
+        assert ast == expected_ast
         assert str(ast) == str(expected_ast)
 
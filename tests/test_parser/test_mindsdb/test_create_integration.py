@@ -29,7 +29,7 @@ class TestCreateIntegration:
                                   parameters=dict(user='admin', password='admin'))
         assert str(ast).lower() == sql.lower()
         assert str(ast) == str(expected_ast)
-        assert ast.to_tree() == expected_ast.to_tree()
+        assert ast == expected_ast
 
     def test_create_datasource_ok(self):
         sql = "CREATE DATASOURCE db WITH ENGINE = 'mysql', PARAMETERS = '{\"user\": \"admin\", \"password\": \"admin\"}'"
@@ -38,7 +38,7 @@ class TestCreateIntegration:
                                   engine='mysql',
                                   parameters=dict(user='admin', password='admin'))
         assert str(ast) == str(expected_ast)
-        assert ast.to_tree() == expected_ast.to_tree()
+        assert ast == expected_ast
 
     def test_create_integration_invalid_json(self):
         sql = "CREATE INTEGRATION db WITH ENGINE = 'mysql', PARAMETERS = 'wow'"
@@ -37,7 +37,7 @@ class TestCreatePredictor:
         )
         assert str(ast).lower() == to_single_line(sql.lower())
         assert to_single_line(str(ast)) == to_single_line(str(expected_ast))
-        assert ast.to_tree() == expected_ast.to_tree()
+        assert ast == expected_ast
 
     def test_create_predictor_minimal(self):
         sql = """CREATE PREDICTOR pred
@@ -57,7 +57,7 @@ class TestCreatePredictor:
         )
         assert str(ast).lower() == to_single_line(sql.lower())
         assert to_single_line(str(ast)) == to_single_line(str(expected_ast))
-        assert ast.to_tree() == expected_ast.to_tree()
+        assert ast == expected_ast
 
     def test_create_predictor_invalid_json(self):
         sql = """CREATE PREDICTOR pred
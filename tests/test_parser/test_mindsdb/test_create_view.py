@@ -31,7 +31,7 @@ class TestCreateView:
 
         assert str(ast).lower() == sql.lower()
         assert str(ast) == str(expected_ast)
-        assert ast.to_tree() == expected_ast.to_tree()
+        assert ast == expected_ast
 
     def test_create_view_nofrom(self):
         sql = "CREATE VIEW my_view AS ( SELECT * FROM pred )"
@@ -42,4 +42,4 @@ class TestCreateView:
 
         assert str(ast).lower() == sql.lower()
         assert str(ast) == str(expected_ast)
-        assert ast.to_tree() == expected_ast.to_tree()
+        assert ast == expected_ast
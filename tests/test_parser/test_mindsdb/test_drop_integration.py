@@ -20,4 +20,4 @@ class TestDropIntegration:
         expected_ast = DropIntegration(name=Identifier('db'))
         assert str(ast).lower() == sql.lower()
         assert str(ast) == str(expected_ast)
-        assert ast.to_tree() == expected_ast.to_tree()
+        assert ast == expected_ast
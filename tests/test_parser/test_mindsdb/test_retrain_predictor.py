@@ -21,4 +21,4 @@ class TestRetrainPredictor:
         expected_ast = RetrainPredictor(name=Identifier('mindsdb.pred'))
         assert str(ast).lower() == sql.lower()
         assert str(ast) == str(expected_ast)
-        assert ast.to_tree() == expected_ast.to_tree()
+        assert ast == expected_ast
@@ -17,7 +17,7 @@ class TestSpecificSelects:
 
         assert str(ast).lower() == sql.lower()
         assert str(ast) == str(expected_ast)
-        assert ast.to_tree() == expected_ast.to_tree()
+        assert ast == expected_ast
 
     def test_select_predict_column(self):
         sql = "SELECT predict FROM mindsdb.predictors"
@@ -29,4 +29,4 @@ class TestSpecificSelects:
 
         assert str(ast).lower() == sql.lower()
         assert str(ast) == str(expected_ast)
-        assert ast.to_tree() == expected_ast.to_tree()
+        assert ast == expected_ast
@@ -18,7 +18,7 @@ class TestShowMindsdb:
 
             assert str(ast).lower() == sql.lower()
             assert str(ast) == str(expected_ast)
-            assert ast.to_tree() == expected_ast.to_tree()
+            assert ast == expected_ast
 
     def test_show_tables_arg(self):
         for keyword in ['VIEWS', 'TABLES']:
@@ -28,5 +28,5 @@ class TestShowMindsdb:
 
             assert str(ast).lower() == sql.lower()
             assert str(ast) == str(expected_ast)
-            assert ast.to_tree() == expected_ast.to_tree()
+            assert ast == expected_ast
 
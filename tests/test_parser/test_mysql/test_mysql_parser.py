@@ -1,21 +1,19 @@
+import pytest
+
 from mindsdb_sql import parse_sql
 from mindsdb_sql.parser.ast import Select, Identifier, BinaryOperation, Star
 from mindsdb_sql.parser.dialects.mysql import Variable
 
 
 class TestMySQLParser:
-    def test_select_variable(self):
-        sql = 'SELECT @version'
-        ast = parse_sql(sql, dialect='mysql')
-        expected_ast = Select(targets=[Variable('version')])
-        assert ast.to_tree() == expected_ast.to_tree()
-        assert str(ast).lower() == sql.lower()
-        assert str(ast) == str(expected_ast)
-
-        sql = 'SELECT @@version'
+    @pytest.mark.parametrize('sql, is_system_var', [
+        ('SELECT @version', False),
+        ('SELECT @@version', True),
+    ])
+    def test_select_variable(self, sql, is_system_var):
         ast = parse_sql(sql, dialect='mysql')
-        expected_ast = Select(targets=[Variable('version', is_system_var=True)])
-        assert ast.to_tree() == expected_ast.to_tree()
+        expected_ast = Select(targets=[Variable('version', is_system_var=is_system_var)])
+        assert ast == expected_ast
         assert str(ast).lower() == sql.lower()
         assert str(ast) == str(expected_ast)
 
@@ -36,6 +34,6 @@ class TestMySQLParser:
                                                     )
                                                     ))
 
-        assert ast.to_tree() == expected_ast.to_tree()
+        assert ast == expected_ast
         assert str(ast).lower() == sql.lower()
         assert str(ast) == str(expected_ast)
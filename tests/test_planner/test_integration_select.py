@@ -41,8 +41,7 @@ class TestPlanIntegrationSelect:
 
         plan = plan_query(query, integrations=['int'])
 
-        for i in range(len(plan.steps)):
-            assert plan.steps[i] == expected_plan.steps[i]
+        assert plan.steps == expected_plan.steps
 
     def test_integration_name_is_case_insensitive(self):
         query = Select(targets=[Identifier('column1')],
@@ -365,8 +364,7 @@ class TestPlanIntegrationSelect:
 
         plan = plan_query(query, integrations=['int'], default_namespace='int')
 
-        for i in range(len(plan.steps)):
-            assert plan.steps[i] == expected_plan.steps[i]
+        assert plan.steps == expected_plan.steps
 
     def test_integration_select_default_namespace_subquery_in_from(self):
         query = Select(targets=[Identifier('column1')],
@@ -10,6 +10,22 @@ from mindsdb_sql.planner.steps import (FetchDataframeStep, ProjectStep, FilterSt
 from mindsdb_sql.utils import JoinType
 
 
+def make_join_predictor_plan(table, columns, **clauses):
+    """Expected plan for `SELECT columns FROM int.<table> JOIN mindsdb.pred`, clauses are pushed to the fetch step"""
+    return QueryPlan(
+        steps=[
+            FetchDataframeStep(integration='int',
+                               query=Select(targets=[Star()], from_table=Identifier(table), **clauses)),
+            ApplyPredictorStep(namespace='mindsdb', dataframe=Result(0), predictor=Identifier('pred')),
+            JoinStep(left=Result(0), right=Result(1),
+                     query=Join(left=Identifier('result_0', alias=Identifier(table)),
+                                right=Identifier('result_1', alias=Identifier('pred')),
+                                join_type=JoinType.INNER_JOIN)),
+            ProjectStep(dataframe=Result(2), columns=columns),
+        ],
+    )
+
+
 class TestPlanJoinPredictor:
     def test_join_predictor_plan(self):
         query = Select(targets=[Identifier('tab1.column1'), Identifier('pred.predicted')],
@@ -18,24 +34,10 @@ class TestPlanJoinPredictor:
                                        join_type=JoinType.INNER_JOIN,
                                        implicit=True)
                        )
-        expected_plan = QueryPlan(
-            steps=[
-                FetchDataframeStep(integration='int',
-                                   query=Select(targets=[Star()],
-                                                from_table=Identifier('tab1')),
-                                   ),
-                ApplyPredictorStep(namespace='mindsdb', dataframe=Result(0), predictor=Identifier('pred')),
-                JoinStep(left=Result(0), right=Result(1),
-                         query=Join(left=Identifier('result_0', alias=Identifier('tab1')),
-                                    right=Identifier('result_1', alias=Identifier('pred')),
-                                    join_type=JoinType.INNER_JOIN)),
-                ProjectStep(dataframe=Result(2), columns=[Identifier('tab1.column1'), Identifier('pred.predicted')]),
-            ],
-        )
-        plan = plan_query(query, integrations=['int'], predictor_namespace='mindsdb')
+        expected_plan = make_join_predictor_plan('tab1', [Identifier('tab1.column1'), Identifier('pred.predicted')])
+        plan = plan_query(query, integrations=['int'])
 
-        for i in range(len(plan.steps)):
-            assert plan.steps[i] == expected_plan.steps[i]
+        assert plan.steps == expected_plan.steps
         
 
     def test_predictor_namespace_is_case_insensitive(self):
@@ -45,20 +47,7 @@ class TestPlanJoinPredictor:
                                        join_type=JoinType.INNER_JOIN,
                                        implicit=True)
                        )
-        expected_plan = QueryPlan(
-            steps=[
-                FetchDataframeStep(integration='int',
-                                   query=Select(targets=[Star()],
-                                                from_table=Identifier('tab1')),
-                                   ),
-                ApplyPredictorStep(namespace='mindsdb', dataframe=Result(0), predictor=Identifier('pred')),
-                JoinStep(left=Result(0), right=Result(1),
-                         query=Join(left=Identifier('result_0', alias=Identifier('tab1')),
-                                    right=Identifier('result_1', alias=Identifier('pred')),
-                                    join_type=JoinType.INNER_JOIN)),
-                ProjectStep(dataframe=Result(2), columns=[Identifier('tab1.column1'), Identifier('pred.predicted')]),
-            ],
-        )
+        expected_plan = make_join_predictor_plan('tab1', [Identifier('tab1.column1'), Identifier('pred.predicted')])
         plan = plan_query(query, integrations=['int'], predictor_namespace='MINDSDB')
 
         assert plan.steps == expected_plan.steps
@@ -85,7 +74,7 @@ class TestPlanJoinPredictor:
                 ProjectStep(dataframe=Result(2), columns=[Identifier('ta.column1'), Identifier('tb.predicted')]),
             ],
         )
-        plan = plan_query(query, integrations=['int'], predictor_namespace='mindsdb')
+        plan = plan_query(query, integrations=['int'])
 
         assert plan.steps == expected_plan.steps
         
@@ -102,30 +91,14 @@ class TestPlanJoinPredictor:
                        ])
                        )
 
-        expected_plan = QueryPlan(
-            steps=[
-                FetchDataframeStep(integration='int',
-                                   query=Select(targets=[Star()],
-                                                from_table=Identifier('tab'),
-                                                where=BinaryOperation('and', args=[
-                                                    BinaryOperation('=',
-                                                                    args=[Identifier('tab.product_id'), Constant('x')]),
-                                                    BetweenOperation(
-                                                        args=[Identifier('tab.time'),
-                                                              Constant('2021-01-01'),
-                                                              Constant('2021-01-31')]),
-                                                ])
-                                                ),
-                                   ),
-                ApplyPredictorStep(namespace='mindsdb', dataframe=Result(0), predictor=Identifier('pred')),
-                JoinStep(left=Result(0), right=Result(1),
-                         query=Join(left=Identifier('result_0', alias=Identifier('tab')),
-                                    right=Identifier('result_1', alias=Identifier('pred')),
-                                    join_type=JoinType.INNER_JOIN)),
-                ProjectStep(dataframe=Result(2), columns=[Identifier('tab.column1'), Identifier('pred.predicted')]),
-            ],
+        expected_plan = make_join_predictor_plan(
+            'tab', [Identifier('tab.column1'), Identifier('pred.predicted')],
+            where=BinaryOperation('and', args=[
+                BinaryOperation('=', args=[Identifier('tab.product_id'), Constant('x')]),
+                BetweenOperation(args=[Identifier('tab.time'), Constant('2021-01-01'), Constant('2021-01-31')]),
+            ]),
         )
-        plan = plan_query(query, integrations=['int'], predictor_namespace='mindsdb')
+        plan = plan_query(query, integrations=['int'])
 
         assert plan.steps == expected_plan.steps
         
@@ -153,7 +126,7 @@ class TestPlanJoinPredictor:
                        )
 
         with pytest.raises(PlanningException):
-            plan_query(query, integrations=['postgres_90'], predictor_namespace='mindsdb')
+            plan_query(query, integrations=['postgres_90'])
 
     def test_join_predictor_plan_group_by(self):
         query = Select(targets=[Identifier('tab.asset'), Identifier('tab.time'), Identifier('pred.predicted')],
@@ -165,25 +138,12 @@ class TestPlanJoinPredictor:
                        having=BinaryOperation('=', args=[Identifier('tab.asset'), Constant('bitcoin')])
                        )
 
-        expected_plan = QueryPlan(
-            steps=[
-                FetchDataframeStep(integration='int',
-                                   query=Select(targets=[Star()],
-                                                from_table=Identifier('tab'),
-                                                group_by=[Identifier('tab.asset')],
-                                                having=BinaryOperation('=', args=[Identifier('tab.asset'),
-                                                                                  Constant('bitcoin')])
-                                                ),
-                                   ),
-                ApplyPredictorStep(namespace='mindsdb', dataframe=Result(0), predictor=Identifier('pred')),
-                JoinStep(left=Result(0), right=Result(1),
-                         query=Join(left=Identifier('result_0', alias=Identifier('tab')),
-                                    right=Identifier('result_1', alias=Identifier('pred')),
-                                    join_type=JoinType.INNER_JOIN)),
-                ProjectStep(dataframe=Result(2), columns=[Identifier('tab.asset'), Identifier('tab.time'), Identifier('pred.predicted')]),
-            ],
+        expected_plan = make_join_predictor_plan(
+            'tab', [Identifier('tab.asset'), Identifier('tab.time'), Identifier('pred.predicted')],
+            group_by=[Identifier('tab.asset')],
+            having=BinaryOperation('=', args=[Identifier('tab.asset'), Constant('bitcoin')]),
         )
-        plan = plan_query(query, integrations=['int'], predictor_namespace='mindsdb')
+        plan = plan_query(query, integrations=['int'])
 
         assert plan.steps == expected_plan.steps
         
@@ -199,25 +159,13 @@ class TestPlanJoinPredictor:
                        offset=Constant(15),
                        )
 
-        expected_plan = QueryPlan(
-            steps=[
-                FetchDataframeStep(integration='int',
-                                   query=Select(targets=[Star()],
-                                                from_table=Identifier('tab'),
-                                                where=BinaryOperation('=', args=[Identifier('tab.product_id'), Constant('x')]),
-                                                limit=Constant(10),
-                                                offset=Constant(15),
-                                                ),
-                                   ),
-                ApplyPredictorStep(namespace='mindsdb', dataframe=Result(0), predictor=Identifier('pred')),
-                JoinStep(left=Result(0), right=Result(1),
-                         query=Join(left=Identifier('result_0', alias=Identifier('tab')),
-                                    right=Identifier('result_1', alias=Identifier('pred')),
-                                    join_type=JoinType.INNER_JOIN)),
-                ProjectStep(dataframe=Result(2), columns=[Identifier('tab.column1'), Identifier('pred.predicted')]),
-            ],
+        expected_plan = make_join_predictor_plan(
+            'tab', [Identifier('tab.column1'), Identifier('pred.predicted')],
+            where=BinaryOperation('=', args=[Identifier('tab.product_id'), Constant('x')]),
+            limit=Constant(10),
+            offset=Constant(15),
         )
-        plan = plan_query(query, integrations=['int'], predictor_namespace='mindsdb')
+        plan = plan_query(query, integrations=['int'])
 
         assert plan.steps == expected_plan.steps
         
@@ -234,26 +182,14 @@ class TestPlanJoinPredictor:
                        order_by=[OrderBy(field=Identifier('tab.column1'))]
                        )
 
-        expected_plan = QueryPlan(
-            steps=[
-                FetchDataframeStep(integration='int',
-                                   query=Select(targets=[Star()],
-                                                from_table=Identifier('tab'),
-                                                where=BinaryOperation('=', args=[Identifier('tab.product_id'), Constant('x')]),
-                                                limit=Constant(10),
-                                                offset=Constant(15),
-                                                order_by=[OrderBy(field=Identifier('tab.column1'))],
-                                                ),
-                                   ),
-                ApplyPredictorStep(namespace='mindsdb', dataframe=Result(0), predictor=Identifier('pred')),
-                JoinStep(left=Result(0), right=Result(1),
-                         query=Join(left=Identifier('result_0', alias=Identifier('tab')),
-                                    right=Identifier('result_1', alias=Identifier('pred')),
-                                    join_type=JoinType.INNER_JOIN)),
-                ProjectStep(dataframe=Result(2), columns=[Identifier('tab.column1'), Identifier('pred.predicted')]),
-            ],
+        expected_plan = make_join_predictor_plan(
+            'tab', [Identifier('tab.column1'), Identifier('pred.predicted')],
+            where=BinaryOperation('=', args=[Identifier('tab.product_id'), Constant('x')]),
+            limit=Constant(10),
+            offset=Constant(15),
+            order_by=[OrderBy(field=Identifier('tab.column1'))],
         )
-        plan = plan_query(query, integrations=['int'], predictor_namespace='mindsdb')
+        plan = plan_query(query, integrations=['int'])
 
         assert plan.steps == expected_plan.steps
         
@@ -279,7 +215,7 @@ class TestPlanJoinPredictor:
                 ProjectStep(dataframe=Result(2), columns=[Identifier('tab1.column1'), Identifier('pred_alias.predicted')]),
             ],
         )
-        plan = plan_query(query, integrations=['int'], predictor_namespace='mindsdb')
+        plan = plan_query(query, integrations=['int'])
 
         assert plan.steps == expected_plan.steps
         
@@ -317,10 +253,9 @@ class TestPlanJoinPredictor:
                 ProjectStep(dataframe=Result(2), columns=[Identifier('tab1.column1'), Identifier('pred.predicted')]),
             ],
         )
-        plan = plan_query(query, integrations=['int'], predictor_namespace='mindsdb', default_namespace='int')
+        plan = plan_query(query, integrations=['int'], default_namespace='int')
 
-        for i in range(len(plan.steps)):
-            assert plan.steps[i] == expected_plan.steps[i]
+        assert plan.steps == expected_plan.steps
 
     def test_join_predictor_plan_default_namespace_predictor(self):
         query = Select(targets=[Identifier('tab1.column1'), Identifier('pred.predicted')],
@@ -344,8 +279,7 @@ class TestPlanJoinPredictor:
                 ProjectStep(dataframe=Result(2), columns=[Identifier('tab1.column1'), Identifier('pred.predicted')]),
             ],
         )
-        plan = plan_query(query, integrations=['int'], predictor_namespace='mindsdb', default_namespace='mindsdb')
+        plan = plan_query(query, integrations=['int'], default_namespace='mindsdb')
 
-        for i in range(len(plan.steps)):
-            assert plan.steps[i] == expected_plan.steps[i]
+        assert plan.steps == expected_plan.steps
 
@@ -1,386 +1,150 @@
+from functools import reduce
+
 import pytest
 
 from mindsdb_sql.exceptions import PlanningException
-from mindsdb_sql.parser.ast import *
+from mindsdb_sql.parser.ast import Select, Join, Identifier, BinaryOperation, Constant, Star, Function, OrderBy
 from mindsdb_sql.planner import plan_query, QueryPlan
 from mindsdb_sql.planner.step_result import Result
-from mindsdb_sql.planner.steps import (FetchDataframeStep, ProjectStep, FilterStep, JoinStep, ApplyPredictorStep,
-                                       ApplyPredictorRowStep, GroupByStep, LimitOffsetStep, OrderByStep)
+from mindsdb_sql.planner.steps import (FetchDataframeStep, ProjectStep, FilterStep, JoinStep, GroupByStep,
+                                       LimitOffsetStep, OrderByStep)
 from mindsdb_sql.utils import JoinType
 
 
-class TestPlanJoinTables:
-    def test_join_tables_plan(self):
-        query = Select(targets=[Identifier('tab1.column1'), Identifier('tab2.column1'), Identifier('tab2.column2')],
-                       from_table=Join(left=Identifier('int.tab1'),
-                                       right=Identifier('int.tab2'),
-                                       condition=BinaryOperation(op='=', args=[Identifier('tab1.column1'), Identifier('tab2.column1')]),
-                                       join_type=JoinType.INNER_JOIN
-                                       )
-                )
-        plan = plan_query(query, integrations=['int'])
-        expected_plan = QueryPlan(integrations=['int'],
-                                  steps = [
-                                      FetchDataframeStep(integration='int',
-                                                         query=Select(
-                                                             targets=[Star()],
-                                                             from_table=Identifier('tab1')),
-                                                         ),
-                                      FetchDataframeStep(integration='int',
-                                                         query=Select(targets=[Star()],
-                                                                      from_table=Identifier('tab2')),
-                                                         ),
-                                      JoinStep(left=Result(0), right=Result(1),
-                                               query=Join(left=Identifier('tab1'),
-                                                          right=Identifier('tab2'),
-                                                          condition=BinaryOperation(op='=',
-                                                                                    args=[Identifier('tab1.column1'),
-                                                                                          Identifier('tab2.column1')]),
-                                                          join_type=JoinType.INNER_JOIN
-                                                          )),
-                                      ProjectStep(dataframe=Result(2),
-                                                  columns=[Identifier('tab1.column1'), Identifier('tab2.column1'), Identifier('tab2.column2')]),
-                                  ],
-        )
+# Every helper builds a fresh tree to keep expected trees independent of the query trees
 
-        assert plan.steps == expected_plan.steps
-        
+def join_condition():
+    return BinaryOperation(op='=', args=[Identifier('tab1.column1'), Identifier('tab2.column1')])
 
-    def test_join_tables_where_plan(self):
-        query = Select(targets=[Identifier('tab1.column1'), Identifier('tab2.column1'), Identifier('tab2.column2')],
-                       from_table=Join(left=Identifier('int.tab1'),
-                                       right=Identifier('int.tab2'),
-                                       condition=BinaryOperation(op='=', args=[Identifier('tab1.column1'),
-                                                                               Identifier('tab2.column1')]),
-                                       join_type=JoinType.INNER_JOIN
-                                       ),
-                       where=BinaryOperation('and',
-                                             args=[
-                                                 BinaryOperation('and',
-                                                                 args=[
-                                                                     BinaryOperation('=',
-                                                                                     args=[Identifier('tab1.column1'),
-                                                                                           Constant(1)]),
-                                                                     BinaryOperation('=',
-                                                                                     args=[Identifier('tab2.column1'),
-                                                                                           Constant(0)]),
 
-                                                                 ]
-                                                                 ),
-                                                 BinaryOperation('=',
-                                                                 args=[Identifier('tab1.column3'),
-                                                                       Identifier('tab2.column3')]),
-                                             ]
-                                             )
-                       )
+def join_tables(left='int.tab1', right='int.tab2', condition=None):
+    return Join(left=Identifier(left),
+                right=Identifier(right),
+                condition=condition or join_condition(),
+                join_type=JoinType.INNER_JOIN)
 
-        plan = plan_query(query, integrations=['int'])
-        expected_plan = QueryPlan(integrations=['int'],
-                                  steps=[
-                                      FetchDataframeStep(integration='int',
-                                                         query=Select(
-                                                             targets=[Star()],
-                                                             from_table=Identifier('tab1'),
-                                                         ),
 
-                                                         ),
-                                      FetchDataframeStep(integration='int',
-                                                         query=Select(targets=[Star()],
-                                                                      from_table=Identifier('tab2'),
-                                                                      ),
-                                                         ),
-                                      JoinStep(left=Result(0), right=Result(1),
-                                               query=Join(left=Identifier('tab1'),
-                                                          right=Identifier('tab2'),
-                                                          condition=BinaryOperation(op='=',
-                                                                                    args=[Identifier('tab1.column1'),
-                                                                                          Identifier('tab2.column1')]),
-                                                          join_type=JoinType.INNER_JOIN
-                                                          )),
-                                      FilterStep(dataframe=Result(2),
-                                                 query=BinaryOperation('and',
-                                                                       args=[
-                                                                           BinaryOperation('and',
-                                                                                           args=[
-                                                                                               BinaryOperation('=',
-                                                                                                               args=[
-                                                                                                                   Identifier(
-                                                                                                                       'tab1.column1'),
-                                                                                                                   Constant(
-                                                                                                                       1)]),
-                                                                                               BinaryOperation('=',
-                                                                                                               args=[
-                                                                                                                   Identifier(
-                                                                                                                       'tab2.column1'),
-                                                                                                                   Constant(
-                                                                                                                       0)]),
+def select_targets():
+    return [Identifier('tab1.column1'), Identifier('tab2.column1'), Identifier('tab2.column2')]
 
-                                                                                           ]
-                                                                                           ),
-                                                                           BinaryOperation('=',
-                                                                                           args=[Identifier(
-                                                                                               'tab1.column3'),
-                                                                                                 Identifier(
-                                                                                                     'tab2.column3')]),
-                                                                       ]
-                                                                       )),
-                                      ProjectStep(dataframe=Result(3),
-                                                  columns=[Identifier('tab1.column1'), Identifier('tab2.column1'), Identifier('tab2.column2')]),
-                                  ],
-                                  )
 
-        assert plan.steps == expected_plan.steps
-        
+def fetch_tables_steps():
+    return [
+        FetchDataframeStep(integration='int', query=Select(targets=[Star()], from_table=Identifier('tab1'))),
+        FetchDataframeStep(integration='int', query=Select(targets=[Star()], from_table=Identifier('tab2'))),
+    ]
 
-    def test_join_tables_plan_groupby(self):
-        query = Select(targets=[
-            Identifier('tab1.column1'),
-            Identifier('tab2.column1'),
-            Function('sum', args=[Identifier('tab2.column2')], alias=Identifier('total'))],
-            from_table=Join(left=Identifier('int.tab1'),
-                            right=Identifier('int.tab2'),
-                            condition=BinaryOperation(op='=',
-                                                      args=[Identifier('tab1.column1'), Identifier('tab2.column1')]),
-                            join_type=JoinType.INNER_JOIN
-                            ),
-            group_by=[Identifier('tab1.column1'), Identifier('tab2.column1')],
-            having=BinaryOperation(op='=', args=[Identifier('tab1.column1'), Constant(0)])
-        )
-        plan = plan_query(query, integrations=['int'])
-        expected_plan = QueryPlan(integrations=['int'],
-                                  steps = [
-                                      FetchDataframeStep(integration='int',
-                                                         query=Select(
-                                                             targets=[Star()],
-                                                             from_table=Identifier('tab1')),
-                                                         ),
-                                      FetchDataframeStep(integration='int',
-                                                         query=Select(targets=[Star()],
-                                                                      from_table=Identifier('tab2')),
-                                                         ),
-                                      JoinStep(left=Result(0), right=Result(1),
-                                               query=Join(left=Identifier('tab1'),
-                                                          right=Identifier('tab2'),
-                                                          condition=BinaryOperation(op='=',
-                                                                                    args=[Identifier('tab1.column1'),
-                                                                                          Identifier('tab2.column1')]),
-                                                          join_type=JoinType.INNER_JOIN
-                                                          )),
-                                      GroupByStep(dataframe=Result(2),
-                                                  targets=[Identifier('tab1.column1'),
-                                                            Identifier('tab2.column1'),
-                                                            Function('sum', args=[Identifier('tab2.column2')])],
-                                                  columns=[Identifier('tab1.column1'), Identifier('tab2.column1')]),
-                                      FilterStep(dataframe=Result(3), query=BinaryOperation(op='=', args=[Identifier('tab1.column1'), Constant(0)])),
-                                      ProjectStep(dataframe=Result(4),
-                                                  columns=[Identifier('tab1.column1'), Identifier('tab2.column1'),
-                                                           Identifier('sum(tab2.column2)', alias=Identifier('total'))]),
-                                  ],
-                                  )
-        assert plan.steps == expected_plan.steps
-        
 
-    def test_join_tables_plan_limit_offset(self):
-        query = Select(targets=[Identifier('tab1.column1'), Identifier('tab2.column1'), Identifier('tab2.column2')],
-                       from_table=Join(left=Identifier('int.tab1'),
-                                       right=Identifier('int.tab2'),
-                                       condition=BinaryOperation(op='=', args=[Identifier('tab1.column1'), Identifier('tab2.column1')]),
-                                       join_type=JoinType.INNER_JOIN
-                                       ),
-                       limit=Constant(10),
-                       offset=Constant(15),
-                )
-        plan = plan_query(query, integrations=['int'])
-        expected_plan = QueryPlan(integrations=['int'],
-                                  steps = [
-                                      FetchDataframeStep(integration='int',
-                                                         query=Select(
-                                                             targets=[Star()],
-                                                             from_table=Identifier('tab1')),
-                                                         ),
-                                      FetchDataframeStep(integration='int',
-                                                         query=Select(targets=[Star()],
-                                                                      from_table=Identifier('tab2')),
-                                                         ),
-                                      JoinStep(left=Result(0), right=Result(1),
-                                               query=Join(left=Identifier('tab1'),
-                                                          right=Identifier('tab2'),
-                                                          condition=BinaryOperation(op='=',
-                                                                                    args=[Identifier('tab1.column1'),
-                                                                                          Identifier('tab2.column1')]),
-                                                          join_type=JoinType.INNER_JOIN
-                                                          )),
-                                      LimitOffsetStep(dataframe=Result(2), limit=10, offset=15),
-                                      ProjectStep(dataframe=Result(3),
-                                                  columns=[Identifier('tab1.column1'), Identifier('tab2.column1'), Identifier('tab2.column2')]),
-                                  ],
-                                  )
+def join_tables_step():
+    return JoinStep(left=Result(0), right=Result(1), query=join_tables(left='tab1', right='tab2'))
+
+
+def and_conditions(*conditions):
+    return reduce(lambda left, right: BinaryOperation('and', args=[left, right]), conditions)
+
+
+def where_condition(ambiguous=False):
+    return and_conditions(
+        BinaryOperation('=', args=[Identifier('tab1.column1'), Constant(1)]),
+        BinaryOperation('=', args=[Identifier('tab2.column1'), Constant(0)]),
+        (BinaryOperation('=', args=[Identifier('column3'), Constant(0)]) if ambiguous
+         else BinaryOperation('=', args=[Identifier('tab1.column3'), Identifier('tab2.column3')])),
+    )
 
-        assert plan.steps == expected_plan.steps
-        
 
-    def test_join_tables_plan_order_by(self):
-        query = Select(targets=[Identifier('tab1.column1'), Identifier('tab2.column1'), Identifier('tab2.column2')],
-                       from_table=Join(left=Identifier('int.tab1'),
-                                       right=Identifier('int.tab2'),
-                                       condition=BinaryOperation(op='=', args=[Identifier('tab1.column1'), Identifier('tab2.column1')]),
-                                       join_type=JoinType.INNER_JOIN
-                                       ),
-                       limit=Constant(10),
-                       offset=Constant(15),
-                       order_by=[OrderBy(field=Identifier('tab1.column1'))],
-                )
+class TestPlanJoinTables:
+    @pytest.mark.parametrize('clauses, extra_steps, columns', [
+        ({}, [], select_targets()),
+        (dict(where=where_condition()),
+         [FilterStep(dataframe=Result(2), query=where_condition())],
+         select_targets()),
+        (dict(targets=[Identifier('tab1.column1'),
+                       Identifier('tab2.column1'),
+                       Function('sum', args=[Identifier('tab2.column2')], alias=Identifier('total'))],
+              group_by=[Identifier('tab1.column1'), Identifier('tab2.column1')],
+              having=BinaryOperation(op='=', args=[Identifier('tab1.column1'), Constant(0)])),
+         [GroupByStep(dataframe=Result(2),
+                      targets=[Identifier('tab1.column1'),
+                               Identifier('tab2.column1'),
+                               Function('sum', args=[Identifier('tab2.column2')])],
+                      columns=[Identifier('tab1.column1'), Identifier('tab2.column1')]),
+          FilterStep(dataframe=Result(3), query=BinaryOperation(op='=', args=[Identifier('tab1.column1'), Constant(0)]))],
+         [Identifier('tab1.column1'), Identifier('tab2.column1'),
+          Identifier('sum(tab2.column2)', alias=Identifier('total'))]),
+        (dict(limit=Constant(10), offset=Constant(15)),
+         [LimitOffsetStep(dataframe=Result(2), limit=10, offset=15)],
+         select_targets()),
+        (dict(limit=Constant(10), offset=Constant(15), order_by=[OrderBy(field=Identifier('tab1.column1'))]),
+         [OrderByStep(dataframe=Result(2), order_by=[OrderBy(field=Identifier('tab1.column1'))]),
+          LimitOffsetStep(dataframe=Result(3), limit=10, offset=15)],
+         select_targets()),
+    ], ids=['plain', 'where', 'groupby', 'limit_offset', 'order_by'])
+    def test_join_tables_plan(self, clauses, extra_steps, columns):
+        # clauses may override the default targets, columns are the projected result
+        query = Select(from_table=join_tables(), **{'targets': select_targets(), **clauses})
         plan = plan_query(query, integrations=['int'])
         expected_plan = QueryPlan(integrations=['int'],
-                                  steps = [
-                                      FetchDataframeStep(integration='int',
-                                                         query=Select(
-                                                             targets=[Star()],
-                                                             from_table=Identifier('tab1')),
-                                                         ),
-                                      FetchDataframeStep(integration='int',
-                                                         query=Select(targets=[Star()],
-                                                                      from_table=Identifier('tab2')),
-                                                         ),
-                                      JoinStep(left=Result(0), right=Result(1),
-                                               query=Join(left=Identifier('tab1'),
-                                                          right=Identifier('tab2'),
-                                                          condition=BinaryOperation(op='=',
-                                                                                    args=[Identifier('tab1.column1'),
-                                                                                          Identifier('tab2.column1')]),
-                                                          join_type=JoinType.INNER_JOIN
-                                                          )),
-                                      OrderByStep(dataframe=Result(2), order_by=[OrderBy(field=Identifier('tab1.column1'))]),
-                                      LimitOffsetStep(dataframe=Result(3), limit=10, offset=15),
-                                      ProjectStep(dataframe=Result(4),
-                                                  columns=[Identifier('tab1.column1'), Identifier('tab2.column1'), Identifier('tab2.column2')]),
+                                  steps=[
+                                      *fetch_tables_steps(),
+                                      join_tables_step(),
+                                      *extra_steps,
+                                      ProjectStep(dataframe=Result(2 + len(extra_steps)), columns=columns),
                                   ],
-                                  )
+        )
 
         assert plan.steps == expected_plan.steps
-        
 
-    def test_join_tables_where_ambigous_column_error(self):
-        query = Select(targets=[Identifier('tab1.column1'), Identifier('tab2.column1'), Identifier('tab2.column2')],
-                       from_table=Join(left=Identifier('int.tab1'),
-                                       right=Identifier('int.tab2'),
-                                       condition=BinaryOperation(op='=', args=[Identifier('tab1.column1'),
-                                                                               Identifier('tab2.column1')]),
-                                       join_type=JoinType.INNER_JOIN
-                                       ),
-                       where=BinaryOperation('and',
-                                             args=[
-                                                 BinaryOperation('and',
-                                                                 args=[
-                                                                     BinaryOperation('=',
-                                                                                     args=[Identifier('tab1.column1'),
-                                                                                           Constant(1)]),
-                                                                     BinaryOperation('=',
-                                                                                     args=[Identifier('tab2.column1'),
-                                                                                           Constant(0)]),
+    def test_join_tables_plan_does_not_change_query(self):
+        query = Select(targets=select_targets(), from_table=join_tables())
+        plan_query(query, integrations=['int'])
 
-                                                                 ]
-                                                                 ),
-                                                 BinaryOperation('=',
-                                                                 args=[Identifier('column3'),
-                                                                       Constant(0)]),
-                                                 # Ambigous column: no idea what table column3 comes from
-                                             ]
-                                             )
-                       )
+        assert query == Select(targets=select_targets(), from_table=join_tables())
+
+    def test_join_tables_where_ambigous_column_error(self):
+        # Ambigous column: no idea what table column3 comes from
+        query = Select(targets=select_targets(), from_table=join_tables(), where=where_condition(ambiguous=True))
 
         with pytest.raises(PlanningException) as e:
             plan_query(query, integrations=['int'])
 
     def test_join_tables_disambiguate_identifiers_in_condition(self):
-        query = Select(targets=[Identifier('tab1.column1'), Identifier('tab2.column1'), Identifier('tab2.column2')],
-                       from_table=Join(left=Identifier('int.tab1'),
-                                       right=Identifier('int.tab2'),
-                                       condition=BinaryOperation(op='=', args=[Identifier('int.tab1.column1'), # integration name included
-                                                                               Identifier('tab2.column1')]),
-                                       join_type=JoinType.INNER_JOIN
-                                       )
+        query = Select(targets=select_targets(),
+                       from_table=join_tables(condition=BinaryOperation(op='=', args=[Identifier('int.tab1.column1'), # integration name included
+                                                                                      Identifier('tab2.column1')]))
                        )
         plan = plan_query(query, integrations=['int'])
         expected_plan = QueryPlan(integrations=['int'],
                                   steps=[
-                                      FetchDataframeStep(integration='int',
-                                                         query=Select(
-                                                             targets=[Star()],
-                                                             from_table=Identifier('tab1')),
-                                                         ),
-                                      FetchDataframeStep(integration='int',
-                                                         query=Select(targets=[Star()],
-                                                                      from_table=Identifier('tab2')),
-                                                         ),
-                                      JoinStep(left=Result(0), right=Result(1),
-                                               query=Join(left=Identifier('tab1'),
-                                                          right=Identifier('tab2'),
-                                                          condition=BinaryOperation(op='=',
-                                                                                    args=[Identifier('tab1.column1'), # integration name gets stripped out
-                                                                                          Identifier('tab2.column1')]),
-                                                          join_type=JoinType.INNER_JOIN
-                                                          )),
-                                      ProjectStep(dataframe=Result(2),
-                                                  columns=[Identifier('tab1.column1'), Identifier('tab2.column1'), Identifier('tab2.column2')]),
+                                      *fetch_tables_steps(),
+                                      join_tables_step(), # integration name gets stripped out
+                                      ProjectStep(dataframe=Result(2), columns=select_targets()),
                                   ],
                                   )
 
         assert plan.steps == expected_plan.steps
-        
 
     def test_join_tables_error_on_unspecified_table_in_condition(self):
-        query = Select(targets=[Identifier('tab1.column1'), Identifier('tab2.column1'), Identifier('tab2.column2')],
-                       from_table=Join(left=Identifier('int.tab1'),
-                                       right=Identifier('int.tab2'),
-                                       condition=BinaryOperation(op='=', args=[Identifier('tab1.column1'),
-                                                                               Identifier('column1')]), #Table name omitted
-                                       join_type=JoinType.INNER_JOIN
-                                       ))
+        query = Select(targets=select_targets(),
+                       from_table=join_tables(condition=BinaryOperation(op='=', args=[Identifier('tab1.column1'),
+                                                                                      Identifier('column1')]))) #Table name omitted
         with pytest.raises(PlanningException):
             plan_query(query, integrations=['int'])
 
     def test_join_tables_error_on_wrong_table_in_condition(self):
-        query = Select(targets=[Identifier('tab1.column1'), Identifier('tab2.column1'), Identifier('tab2.column2')],
-                       from_table=Join(left=Identifier('int.tab1'),
-                                       right=Identifier('int.tab2'),
-                                       condition=BinaryOperation(op='=', args=[Identifier('tab1.column1'),
-                                                                               Identifier('tab3.column1')]), #Wrong table name
-                                       join_type=JoinType.INNER_JOIN
-                                       ))
+        query = Select(targets=select_targets(),
+                       from_table=join_tables(condition=BinaryOperation(op='=', args=[Identifier('tab1.column1'),
+                                                                                      Identifier('tab3.column1')]))) #Wrong table name
         with pytest.raises(PlanningException) as e:
             plan_query(query, integrations=['int'])
 
     def test_join_tables_plan_default_namespace(self):
-        query = Select(targets=[Identifier('tab1.column1'), Identifier('tab2.column1'), Identifier('tab2.column2')],
-                       from_table=Join(left=Identifier('tab1'),
-                                       right=Identifier('tab2'),
-                                       condition=BinaryOperation(op='=', args=[Identifier('tab1.column1'), Identifier('tab2.column1')]),
-                                       join_type=JoinType.INNER_JOIN
-                                       )
-                )
+        query = Select(targets=select_targets(), from_table=join_tables(left='tab1', right='tab2'))
         expected_plan = QueryPlan(integrations=['int'],
                                   default_namespace='int',
-                                  steps = [
-                                      FetchDataframeStep(integration='int',
-                                                         query=Select(
-                                                             targets=[Star()],
-                                                             from_table=Identifier('tab1')),
-                                                         ),
-                                      FetchDataframeStep(integration='int',
-                                                         query=Select(targets=[Star()],
-                                                                      from_table=Identifier('tab2')),
-                                                         ),
-                                      JoinStep(left=Result(0), right=Result(1),
-                                               query=Join(left=Identifier('tab1'),
-                                                          right=Identifier('tab2'),
-                                                          condition=BinaryOperation(op='=',
-                                                                                    args=[Identifier('tab1.column1'),
-                                                                                          Identifier('tab2.column1')]),
-                                                          join_type=JoinType.INNER_JOIN
-                                                          )),
-                                      ProjectStep(dataframe=Result(2),
-                                                  columns=[Identifier('tab1.column1'), Identifier('tab2.column1'), Identifier('tab2.column2')]),
+                                  steps=[
+                                      *fetch_tables_steps(),
+                                      join_tables_step(),
+                                      ProjectStep(dataframe=Result(2), columns=select_targets()),
                                   ],
         )
         plan = plan_query(query, integrations=['int'], default_namespace='int')
@@ -65,6 +65,5 @@ class TestPlanUnion:
 
         plan = plan_query(query, integrations=['int'], predictor_namespace='mindsdb')
 
-        for i in range(len(plan.steps)):
-            assert plan.steps[i] == expected_plan.steps[i]
+        assert plan.steps == expected_plan.steps
         
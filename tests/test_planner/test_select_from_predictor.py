@@ -173,7 +173,7 @@ class TestPlanSelectFromPredictor:
                                        from_table=Identifier('hdi_predictor_external'),
                                        where=BinaryOperation(op="=",
                                                              args=[Constant(1), Constant(0)]))
-        assert query.to_tree() == expected_query.to_tree()
+        assert query == expected_query
 
         expected_plan = QueryPlan(predictor_namespace='mindsdb',
                                   default_namespace='mindsdb',
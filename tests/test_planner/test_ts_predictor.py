@@ -1,3 +1,5 @@
+from functools import reduce
+
 import pytest
 
 from mindsdb_sql import parse_sql
@@ -11,815 +13,181 @@ from mindsdb_sql.planner.steps import (FetchDataframeStep, ProjectStep, ApplyTim
 from mindsdb_sql.utils import JoinType
 
 
-class TestJoinTimeseriesPredictor:
-    def test_join_predictor_timeseries(self):
-        predictor_window = 10
-        group_by_column = 'vendor_id'
-        query = Select(targets=[Star()],
-                       from_table=Join(left=Identifier('mysql.data.ny_output', alias=Identifier('ta')),
-                                       right=Identifier('mindsdb.tp3', alias=Identifier('tb')),
-                                       join_type='join'),
-                       )
+def ts_predictor_metadata(window=10):
+    return {
+        'tp3': {'timeseries': True,
+                'order_by_column': 'pickup_hour',
+                'group_by_column': 'vendor_id',
+                'window': window}
+    }
 
-        expected_plan = QueryPlan(
-            steps=[
-                FetchDataframeStep(integration='mysql',
-                                   query=Select(targets=[Identifier(parts=['ta', group_by_column], alias=Identifier(group_by_column))],
-                                                from_table=Identifier('data.ny_output', alias=Identifier('ta')),
-                                                distinct=True,
-                                                )
-                                   ),
-                MapReduceStep(values=Result(0),
-                              reduce='union',
-                              step=FetchDataframeStep(integration='mysql',
-                                   query=Select(targets=[Star()],
-                                                from_table=Identifier('data.ny_output', alias=Identifier('ta')),
-                                                where=BinaryOperation('=', args=[Identifier('ta.vendor_id'), Constant('$var')]),
-                                                order_by=[OrderBy(Identifier('ta.pickup_hour'), direction='DESC')],
-                                                )
-                                   ),
-                              ),
-                ApplyTimeseriesPredictorStep(namespace='mindsdb',
-                                             predictor=Identifier('tp3', alias=Identifier('tb')),
-                                             dataframe=Result(1)),
-                JoinStep(left=Result(2),
-                         right=Result(1),
-                         query=Join(
-                             left=Identifier('result_2', alias=Identifier('tb')),
-                             right=Identifier('result_1', alias=Identifier('ta')),
-                             join_type=JoinType.LEFT_JOIN)
-                         ),
-                ProjectStep(dataframe=Result(3), columns=[Star()]),
-            ],
-        )
 
-        plan = plan_query(query,
-                          integrations=['mysql'],
-                          predictor_namespace='mindsdb',
-                          predictor_metadata={
-                              'tp3': {'timeseries': True,
-                                       'order_by_column': 'pickup_hour',
-                                       'group_by_column': group_by_column,
-                                       'window': predictor_window}
-                          })
-
-        for i in range(len(plan.steps)):
-            assert plan.steps[i] == expected_plan.steps[i]
-
-    def test_join_predictor_timeseries_select_table_columns(self):
-        predictor_window = 10
-        group_by_column = 'vendor_id'
-        query = Select(targets=[Identifier('ta.target', alias=Identifier('y_true')),
-                                Identifier('tb.target', alias=Identifier('y_pred'))],
-                       from_table=Join(left=Identifier('mysql.data.ny_output', alias=Identifier('ta')),
-                                       right=Identifier('mindsdb.tp3', alias=Identifier('tb')),
-                                       join_type='join'),
-                       )
+def ts_join_query(left='mysql.data.ny_output', right='mindsdb.tp3', targets=None, **clauses):
+    return Select(targets=targets or [Star()],
+                  from_table=Join(left=Identifier(left, alias=Identifier('ta')),
+                                  right=Identifier(right, alias=Identifier('tb')),
+                                  join_type='join'),
+                  **clauses)
 
-        expected_plan = QueryPlan(
-            steps=[
-                FetchDataframeStep(integration='mysql',
-                                   query=Select(targets=[Identifier(parts=['ta', group_by_column], alias=Identifier(group_by_column))],
-                                                from_table=Identifier('data.ny_output', alias=Identifier('ta')),
-                                                distinct=True,
-                                                )
-                                   ),
-                MapReduceStep(values=Result(0),
-                              reduce='union',
-                              step=FetchDataframeStep(integration='mysql',
-                                   query=Select(targets=[Star()],
-                                                from_table=Identifier('data.ny_output', alias=Identifier('ta')),
-                                                where=BinaryOperation('=', args=[Identifier('ta.vendor_id'), Constant('$var')]),
-                                                order_by=[OrderBy(Identifier('ta.pickup_hour'), direction='DESC')],
-                                                )
-                                   ),
-                              ),
-                ApplyTimeseriesPredictorStep(namespace='mindsdb',
-                                             predictor=Identifier('tp3', alias=Identifier('tb')),
-                                             dataframe=Result(1)),
-                JoinStep(left=Result(2),
-                         right=Result(1),
-                         query=Join(
-                             left=Identifier('result_2', alias=Identifier('tb')),
-                             right=Identifier('result_1', alias=Identifier('ta')),
-                             join_type=JoinType.LEFT_JOIN)
-                         ),
-                ProjectStep(dataframe=Result(3), columns=[Identifier('ta.target', alias=Identifier('y_true')), Identifier('tb.target', alias=Identifier('y_pred'))]),
-            ],
-        )
 
-        plan = plan_query(query,
-                          integrations=['mysql'],
-                          predictor_namespace='mindsdb',
-                          predictor_metadata={
-                              'tp3': {'timeseries': True,
-                                       'order_by_column': 'pickup_hour',
-                                       'group_by_column': group_by_column,
-                                       'window': predictor_window}
-                          })
-
-        for i in range(len(plan.steps)):
-            assert plan.steps[i] == expected_plan.steps[i]
-
-    def test_join_predictor_timeseries_query_with_limit(self):
-        predictor_window = 10
-        group_by_column = 'vendor_id'
-        query = Select(targets=[Star()],
-                       from_table=Join(left=Identifier('mysql.data.ny_output', alias=Identifier('ta')),
-                                       right=Identifier('mindsdb.tp3', alias=Identifier('tb')),
-                                       join_type='join'),
-                       limit=Constant(1000),
-                       )
+def and_conditions(*conditions):
+    return reduce(lambda left, right: BinaryOperation('and', args=[left, right]), conditions)
 
-        expected_plan = QueryPlan(
-            steps=[
-                FetchDataframeStep(integration='mysql',
-                                   query=Select(targets=[
-                                       Identifier(parts=['ta', group_by_column], alias=Identifier(group_by_column))],
-                                                from_table=Identifier('data.ny_output', alias=Identifier('ta')),
-                                                distinct=True,
-                                                )
-                                   ),
-                MapReduceStep(values=Result(0),
-                              reduce='union',
-                              step=FetchDataframeStep(integration='mysql',
-                                                      query=Select(targets=[Star()],
-                                                                   from_table=Identifier('data.ny_output',
-                                                                                         alias=Identifier('ta')),
-                                                                   where=BinaryOperation('=', args=[
-                                                                       Identifier('ta.vendor_id'), Constant('$var')]),
-                                                                   order_by=[OrderBy(Identifier('ta.pickup_hour'),
-                                                                                     direction='DESC')],
-                                                                   )
-                                                      ),
-                              ),
-                ApplyTimeseriesPredictorStep(namespace='mindsdb',
-                                             predictor=Identifier('tp3', alias=Identifier('tb')),
-                                             dataframe=Result(1)),
-                JoinStep(left=Result(2),
-                         right=Result(1),
-                         query=Join(
-                             left=Identifier('result_2', alias=Identifier('tb')),
-                             right=Identifier('result_1', alias=Identifier('ta')),
-                             join_type=JoinType.LEFT_JOIN)
-                         ),
-                LimitOffsetStep(dataframe=Result(3), limit=query.limit),
-                ProjectStep(dataframe=Result(4), columns=[Star()]),
-            ],
-        )
 
-        plan = plan_query(query,
-                          integrations=['mysql'],
-                          predictor_namespace='mindsdb',
-                          predictor_metadata={
-                              'tp3': {'timeseries': True,
-                                       'order_by_column': 'pickup_hour',
-                                       'group_by_column': 'vendor_id',
-                                       'window': predictor_window}
-                          })
-
-        for i in range(len(plan.steps)):
-            assert plan.steps[i] == expected_plan.steps[i]
-
-    def test_join_predictor_timeseries_filter_by_group_by_column(self):
-        predictor_window = 10
-        group_by_column = 'vendor_id'
-        query = Select(targets=[Star()],
-                       from_table=Join(left=Identifier('mysql.data.ny_output', alias=Identifier('ta')),
-                                       right=Identifier('mindsdb.tp3', alias=Identifier('tb')),
-                                       join_type='join'),
-                       where=BinaryOperation('=', args=[Identifier('ta.vendor_id'), Constant(1)]),
-                       )
+def group_fetch_where(*conditions):
+    """WHERE of a partition fetch: the pushed down conditions followed by the group by column placeholder"""
+    var_condition = BinaryOperation('=', args=[Identifier('ta.vendor_id'), Constant('$var')])
+    if not conditions:
+        return var_condition
+    return BinaryOperation('and', args=[and_conditions(*conditions), var_condition])
 
-        expected_plan = QueryPlan(
-            steps=[
-                FetchDataframeStep(integration='mysql',
-                                   query=Select(targets=[
-                                       Identifier(parts=['ta', group_by_column], alias=Identifier(group_by_column))],
-                                                from_table=Identifier('data.ny_output', alias=Identifier('ta')),
-                                                where=BinaryOperation('=', args=[Identifier('ta.vendor_id'), Constant(1)]),
-                                                distinct=True,
-                                                )
-                                   ),
-                MapReduceStep(values=Result(0),
-                              reduce='union',
-                              step=FetchDataframeStep(integration='mysql',
-                                                      query=Select(targets=[Star()],
-                                                                   from_table=Identifier('data.ny_output',
-                                                                                         alias=Identifier('ta')),
-                                                                   where=BinaryOperation('and', args=[
-                                                                       BinaryOperation('=',
-                                                                                       args=[Identifier('ta.vendor_id'),
-                                                                                             Constant(1)]),
-                                                                       BinaryOperation('=', args=[
-                                                                           Identifier('ta.vendor_id'),
-                                                                           Constant('$var')]),
-                                                                   ]),
-                                                                   order_by=[OrderBy(Identifier('ta.pickup_hour'),
-                                                                                     direction='DESC')],
-                                                                   )
-                                                      ),
-                              ),
-                ApplyTimeseriesPredictorStep(namespace='mindsdb',
-                                             predictor=Identifier('tp3', alias=Identifier('tb')),
-                                             dataframe=Result(1)),
-                JoinStep(left=Result(2),
-                         right=Result(1),
-                         query=Join(
-                             left=Identifier('result_2', alias=Identifier('tb')),
-                             right=Identifier('result_1', alias=Identifier('ta')),
-                             join_type=JoinType.LEFT_JOIN)
-                         ),
-                ProjectStep(dataframe=Result(3), columns=[Star()]),
-            ],
-        )
 
-        plan = plan_query(query,
-                          integrations=['mysql'],
-                          predictor_namespace='mindsdb',
-                          predictor_metadata={
-                              'tp3': {'timeseries': True,
-                                       'order_by_column': 'pickup_hour',
-                                       'group_by_column': 'vendor_id',
-                                       'window': predictor_window}
-                          })
+def partition_fetch_step(where, limit=None):
+    return FetchDataframeStep(integration='mysql',
+                              query=Select(targets=[Star()],
+                                           from_table=Identifier('data.ny_output', alias=Identifier('ta')),
+                                           where=where,
+                                           order_by=[OrderBy(Identifier('ta.pickup_hour'), direction='DESC')],
+                                           limit=limit))
+
+
+def make_ts_predictor_plan(partition_step, columns=None, group_where=None, output_time_filter=None, extra_steps=(),
+                           default_namespace=None):
+    """Expected plan for `SELECT ... FROM mysql.data.ny_output AS ta JOIN mindsdb.tp3 AS tb` grouped by vendor_id"""
+    return QueryPlan(
+        steps=[
+            FetchDataframeStep(integration='mysql',
+                               query=Select(targets=[Identifier(parts=['ta', 'vendor_id'], alias=Identifier('vendor_id'))],
+                                            from_table=Identifier('data.ny_output', alias=Identifier('ta')),
+                                            where=group_where,
+                                            distinct=True)),
+            MapReduceStep(values=Result(0), reduce='union', step=partition_step),
+            ApplyTimeseriesPredictorStep(output_time_filter=output_time_filter,
+                                         namespace='mindsdb',
+                                         predictor=Identifier('tp3', alias=Identifier('tb')),
+                                         dataframe=Result(1)),
+            JoinStep(left=Result(2),
+                     right=Result(1),
+                     query=Join(left=Identifier('result_2', alias=Identifier('tb')),
+                                right=Identifier('result_1', alias=Identifier('ta')),
+                                join_type=JoinType.LEFT_JOIN)),
+            *extra_steps,
+            ProjectStep(dataframe=Result(3 + len(extra_steps)), columns=columns or [Star()]),
+        ],
+        default_namespace=default_namespace,
+    )
+
+
+def vendor_filter():
+    return BinaryOperation('=', args=[Identifier('ta.vendor_id'), Constant(1)])
+
+
+def time_filter(op, value=10):
+    return BinaryOperation(op, args=[Identifier('ta.pickup_hour'), Constant(value)])
+
 
-        for i in range(len(plan.steps)):
-            assert plan.steps[i] == expected_plan.steps[i]
+class TestJoinTimeseriesPredictor:
+    @pytest.mark.parametrize('clauses, expected_plan', [
+        ({}, make_ts_predictor_plan(partition_fetch_step(group_fetch_where()))),
+        (dict(targets=[Identifier('ta.target', alias=Identifier('y_true')),
+                       Identifier('tb.target', alias=Identifier('y_pred'))]),
+         make_ts_predictor_plan(partition_fetch_step(group_fetch_where()),
+                                columns=[Identifier('ta.target', alias=Identifier('y_true')),
+                                         Identifier('tb.target', alias=Identifier('y_pred'))])),
+        (dict(limit=Constant(1000)),
+         make_ts_predictor_plan(partition_fetch_step(group_fetch_where()),
+                                extra_steps=[LimitOffsetStep(dataframe=Result(3), limit=Constant(1000))])),
+        (dict(where=vendor_filter()),
+         make_ts_predictor_plan(partition_fetch_step(group_fetch_where(vendor_filter())),
+                                group_where=vendor_filter())),
+    ], ids=['plain', 'select_table_columns', 'query_with_limit', 'filter_by_group_by_column'])
+    def test_join_predictor_timeseries(self, clauses, expected_plan):
+        query = ts_join_query(**clauses)
+        plan = plan_query(query, integrations=['mysql'], predictor_metadata=ts_predictor_metadata())
+
+        assert plan == expected_plan
 
     def test_join_predictor_timeseries_latest(self):
         predictor_window = 5
-        group_by_column = 'vendor_id'
         query = Select(targets=[Star()],
                        from_table=Join(left=Identifier('mysql.data.ny_output', alias=Identifier('ta')),
                                        right=Identifier('mindsdb.tp3', alias=Identifier('tb')),
                                        join_type=None,
                                        implicit=True),
-                       where=BinaryOperation('and', args=[
-                           BinaryOperation('>', args=[Identifier('ta.pickup_hour'), Latest()]),
-                           BinaryOperation('=', args=[Identifier('ta.vendor_id'), Constant(1)]),
-                       ]),
+                       where=and_conditions(BinaryOperation('>', args=[Identifier('ta.pickup_hour'), Latest()]),
+                                            vendor_filter()),
                        )
 
-        expected_plan = QueryPlan(
-            steps=[
-                FetchDataframeStep(integration='mysql',
-                                   query=Select(targets=[
-                                       Identifier(parts=['ta', group_by_column], alias=Identifier(group_by_column))],
-                                       from_table=Identifier('data.ny_output', alias=Identifier('ta')),
-                                       where=BinaryOperation('=', args=[Identifier('ta.vendor_id'), Constant(1)]),
-                                       distinct=True,
-                                   )
-                                   ),
-                MapReduceStep(values=Result(0),
-                              reduce='union',
-                              step=FetchDataframeStep(integration='mysql',
-                                                      query=Select(targets=[Star()],
-                                                                   from_table=Identifier('data.ny_output',
-                                                                                         alias=Identifier('ta')),
-                                                                   where=BinaryOperation('and', args=[
-                                                                       BinaryOperation('=',
-                                                                                       args=[Identifier('ta.vendor_id'),
-                                                                                             Constant(1)]),
-                                                                       BinaryOperation('=', args=[
-                                                                           Identifier('ta.vendor_id'),
-                                                                           Constant('$var')]),
-                                                                   ]),
-                                                                   order_by=[OrderBy(Identifier('ta.pickup_hour'),
-                                                                                     direction='DESC')],
-                                                                   limit=Constant(predictor_window),
-                                                                   )
-                                                      ),
-                              ),
-                ApplyTimeseriesPredictorStep(
-                    output_time_filter=BinaryOperation('>', args=[Identifier('ta.pickup_hour'), Latest()]),
-                    namespace='mindsdb',
-                    predictor=Identifier('tp3', alias=Identifier('tb')),
-                    dataframe=Result(1),
-                ),
-                JoinStep(left=Result(2),
-                         right=Result(1),
-                         query=Join(
-                             left=Identifier('result_2', alias=Identifier('tb')),
-                             right=Identifier('result_1', alias=Identifier('ta')),
-                             join_type=JoinType.LEFT_JOIN)
-                         ),
-                ProjectStep(dataframe=Result(3), columns=[Star()]),
-            ],
+        expected_plan = make_ts_predictor_plan(
+            partition_fetch_step(group_fetch_where(vendor_filter()), limit=Constant(predictor_window)),
+            group_where=vendor_filter(),
+            output_time_filter=BinaryOperation('>', args=[Identifier('ta.pickup_hour'), Latest()]),
         )
 
-        plan = plan_query(query,
-                          integrations=['mysql'],
-                          predictor_namespace='mindsdb',
-                          predictor_metadata={
-                              'tp3': {'timeseries': True,
-                                      'order_by_column': 'pickup_hour',
-                                      'group_by_column': 'vendor_id',
-                                      'window': predictor_window}
-                          })
+        plan = plan_query(query, integrations=['mysql'], predictor_metadata=ts_predictor_metadata(predictor_window))
 
-        for i in range(len(plan.steps)):
-            assert plan.steps[i] == expected_plan.steps[i]
+        assert plan == expected_plan
 
     def test_join_predictor_timeseries_between(self):
         predictor_window = 5
-        group_by_column = 'vendor_id'
         query = Select(targets=[Star()],
                        from_table=Join(left=Identifier('mysql.data.ny_output', alias=Identifier('ta')),
                                        right=Identifier('mindsdb.tp3', alias=Identifier('tb')),
                                        join_type=None,
                                        implicit=True),
-                       where=BinaryOperation('and', args=[
-                           BetweenOperation(args=[Identifier('ta.pickup_hour'), Constant(1), Constant(10)]),
-                           BinaryOperation('=', args=[Identifier('ta.vendor_id'), Constant(1)]),
-                       ]),
-                       )
-
-        expected_plan = QueryPlan(
-            steps=[
-                FetchDataframeStep(integration='mysql',
-                                   query=Select(targets=[
-                                       Identifier(parts=['ta', group_by_column], alias=Identifier(group_by_column))],
-                                       from_table=Identifier('data.ny_output', alias=Identifier('ta')),
-                                       where=BinaryOperation('=', args=[Identifier('ta.vendor_id'), Constant(1)]),
-                                       distinct=True,
-                                   )
-                                   ),
-                MapReduceStep(values=Result(0),
-                              reduce='union',
-                              step=MultipleSteps(
-                                  reduce='union',
-                                  steps=[
-                                      FetchDataframeStep(integration='mysql',
-                                                         query=Select(targets=[Star()],
-                                                                      from_table=Identifier('data.ny_output',
-                                                                                            alias=Identifier('ta')),
-                                                                      where=BinaryOperation('and', args=[
-                                                                          BinaryOperation('and', args=[
-                                                                              BinaryOperation('<',
-                                                                                              args=[Identifier(
-                                                                                                  'ta.pickup_hour'),
-                                                                                                  Constant(1)]),
-                                                                              BinaryOperation('=',
-                                                                                              args=[Identifier(
-                                                                                                  'ta.vendor_id'),
-                                                                                                  Constant(1)]),
-                                                                          ]),
-                                                                          BinaryOperation('=', args=[
-                                                                              Identifier('ta.vendor_id'),
-                                                                              Constant('$var')])
-                                                                      ]),
-                                                                      order_by=[OrderBy(Identifier('ta.pickup_hour'),
-                                                                                        direction='DESC')],
-                                                                      limit=Constant(predictor_window),
-                                                                      ),
-                                                         ),
-                                      FetchDataframeStep(integration='mysql',
-                                                         query=Select(targets=[Star()],
-                                                                      from_table=Identifier('data.ny_output',
-                                                                                            alias=Identifier('ta')),
-                                                                      where=BinaryOperation('and', args=[
-                                                                          BinaryOperation('and', args=[
-                                                                              BetweenOperation(
-                                                                                  args=[Identifier('ta.pickup_hour'),
-                                                                                        Constant(1), Constant(10)]),
-                                                                              BinaryOperation('=',
-                                                                                              args=[Identifier(
-                                                                                                  'ta.vendor_id'),
-                                                                                                  Constant(1)]),
-                                                                          ]),
-
-                                                                          BinaryOperation('=', args=[
-                                                                              Identifier('ta.vendor_id'),
-                                                                              Constant('$var')])
-                                                                      ]),
-                                                                      order_by=[OrderBy(Identifier('ta.pickup_hour'),
-                                                                                        direction='DESC')],
-                                                                      ),
-                                                         ),
-
-                                  ]
-                              )),
-                ApplyTimeseriesPredictorStep(
-                    output_time_filter=BetweenOperation(
-                        args=[Identifier('ta.pickup_hour'), Constant(1), Constant(10)],
-                    ),
-                    namespace='mindsdb',
-                    predictor=Identifier('tp3', alias=Identifier('tb')),
-                    dataframe=Result(1),
-                ),
-                JoinStep(left=Result(2),
-                         right=Result(1),
-                         query=Join(
-                             left=Identifier('result_2', alias=Identifier('tb')),
-                             right=Identifier('result_1', alias=Identifier('ta')),
-                             join_type=JoinType.LEFT_JOIN)
-                         ),
-                ProjectStep(dataframe=Result(3), columns=[Star()]),
-            ],
-        )
-
-        plan = plan_query(query,
-                          integrations=['mysql'],
-                          predictor_namespace='mindsdb',
-                          predictor_metadata={
-                              'tp3': {'timeseries': True,
-                                      'order_by_column': 'pickup_hour',
-                                      'group_by_column': 'vendor_id',
-                                      'window': predictor_window}
-                          })
-
-        for i in range(len(plan.steps)):
-            assert plan.steps[i] == expected_plan.steps[i]
-
-    def test_join_predictor_timeseries_concrete_date_greater(self):
-        predictor_window = 10
-        group_by_column = 'vendor_id'
-
-        sql = "select * from mysql.data.ny_output as ta join mindsdb.tp3 as tb where ta.pickup_hour > 10 and ta.vendor_id = 1"
-        query = Select(targets=[Star()],
-                       from_table=Join(left=Identifier('mysql.data.ny_output', alias=Identifier('ta')),
-                                       right=Identifier('mindsdb.tp3', alias=Identifier('tb')),
-                                       join_type='join'),
-                       where=BinaryOperation('and', args=[
-                           BinaryOperation('>', args=[Identifier('ta.pickup_hour'), Constant(10)]),
-                           BinaryOperation('=', args=[Identifier(parts=['ta', group_by_column]), Constant(1)]),
-                       ]),
+                       where=and_conditions(BetweenOperation(args=[Identifier('ta.pickup_hour'), Constant(1), Constant(10)]),
+                                            vendor_filter()),
                        )
 
-        assert parse_sql(sql, dialect='mindsdb').to_tree() == query.to_tree()
-
-        expected_plan = QueryPlan(
-            steps=[
-                FetchDataframeStep(integration='mysql',
-                                   query=Select(targets=[
-                                       Identifier(parts=['ta', group_by_column], alias=Identifier(group_by_column))],
-                                       from_table=Identifier('data.ny_output', alias=Identifier('ta')),
-                                       where=BinaryOperation('=', args=[Identifier('ta.vendor_id'), Constant(1)]),
-                                       distinct=True,
-                                   )
-                                   ),
-                MapReduceStep(values=Result(0),
-                              reduce='union',
-                              step=MultipleSteps(
-                                  reduce='union',
-                                  steps=[
-                                      FetchDataframeStep(integration='mysql',
-                                                         query=Select(targets=[Star()],
-                                                                      from_table=Identifier('data.ny_output',
-                                                                                            alias=Identifier('ta')),
-                                                                      where=BinaryOperation('and', args=[
-                                                                          BinaryOperation('and', args=[
-                                                                              BinaryOperation('<=',
-                                                                                              args=[Identifier(
-                                                                                                  'ta.pickup_hour'),
-                                                                                                  Constant(10)]),
-                                                                              BinaryOperation('=',
-                                                                                              args=[Identifier(
-                                                                                                  'ta.vendor_id'),
-                                                                                                  Constant(1)]),
-                                                                          ]),
-                                                                          BinaryOperation('=', args=[
-                                                                              Identifier('ta.vendor_id'),
-                                                                              Constant('$var')])
-                                                                      ]),
-                                                                      order_by=[OrderBy(Identifier('ta.pickup_hour'),
-                                                                                        direction='DESC')],
-                                                                      limit=Constant(predictor_window),
-                                                                      ),
-                                                         ),
-                                      FetchDataframeStep(integration='mysql',
-                                                         query=Select(targets=[Star()],
-                                                                      from_table=Identifier('data.ny_output',
-                                                                                            alias=Identifier('ta')),
-                                                                      where=BinaryOperation('and', args=[
-                                                                          BinaryOperation('and', args=[
-                                                                              BinaryOperation('>',
-                                                                                              args=[Identifier(
-                                                                                                  'ta.pickup_hour'),
-                                                                                                  Constant(10)]),
-                                                                              BinaryOperation('=',
-                                                                                              args=[Identifier(
-                                                                                                  'ta.vendor_id'),
-                                                                                                  Constant(1)]),
-                                                                          ]),
-
-                                                                          BinaryOperation('=', args=[
-                                                                              Identifier('ta.vendor_id'),
-                                                                              Constant('$var')])
-                                                                      ]),
-                                                                      order_by=[OrderBy(Identifier('ta.pickup_hour'),
-                                                                                        direction='DESC')],
-                                                                      ),
-                                                         ),
-
-                                  ]
-                              )),
-                ApplyTimeseriesPredictorStep(output_time_filter=BinaryOperation('>', args=[Identifier('ta.pickup_hour'), Constant(10)]),
-                                             namespace='mindsdb',
-                                             predictor=Identifier('tp3', alias=Identifier('tb')),
-                                             dataframe=Result(1)),
-                JoinStep(left=Result(2),
-                         right=Result(1),
-                         query=Join(
-                             left=Identifier('result_2', alias=Identifier('tb')),
-                             right=Identifier('result_1', alias=Identifier('ta')),
-                             join_type=JoinType.LEFT_JOIN)
-                         ),
-                ProjectStep(dataframe=Result(3), columns=[Star()]),
-            ],
+        expected_plan = make_ts_predictor_plan(
+            MultipleSteps(
+                reduce='union',
+                steps=[
+                    partition_fetch_step(group_fetch_where(time_filter('<', 1), vendor_filter()),
+                                         limit=Constant(predictor_window)),
+                    partition_fetch_step(group_fetch_where(
+                        BetweenOperation(args=[Identifier('ta.pickup_hour'), Constant(1), Constant(10)]),
+                        vendor_filter())),
+                ]),
+            group_where=vendor_filter(),
+            output_time_filter=BetweenOperation(args=[Identifier('ta.pickup_hour'), Constant(1), Constant(10)]),
         )
 
-        plan = plan_query(query,
-                          integrations=['mysql'],
-                          predictor_namespace='mindsdb',
-                          predictor_metadata={
-                              'tp3': {'timeseries': True,
-                                       'order_by_column': 'pickup_hour',
-                                       'group_by_column': 'vendor_id',
-                                       'window': predictor_window}
-                          })
-
-        for i in range(len(plan.steps)):
-            assert plan.steps[i] == expected_plan.steps[i]
-
-    def test_join_predictor_timeseries_concrete_date_greater_or_equal(self):
-        predictor_window = 10
-        group_by_column = 'vendor_id'
+        plan = plan_query(query, integrations=['mysql'], predictor_metadata=ts_predictor_metadata(predictor_window))
 
-        sql = "select * from mysql.data.ny_output as ta join mindsdb.tp3 as tb where ta.pickup_hour >= 10 and ta.vendor_id = 1"
-        query = Select(targets=[Star()],
-                       from_table=Join(left=Identifier('mysql.data.ny_output', alias=Identifier('ta')),
-                                       right=Identifier('mindsdb.tp3', alias=Identifier('tb')),
-                                       join_type='join'),
-                       where=BinaryOperation('and', args=[
-                           BinaryOperation('>=', args=[Identifier('ta.pickup_hour'), Constant(10)]),
-                           BinaryOperation('=', args=[Identifier(parts=['ta', group_by_column]), Constant(1)]),
-                       ]),
-                       )
-
-        assert parse_sql(sql, dialect='mindsdb').to_tree() == query.to_tree()
-
-        expected_plan = QueryPlan(
-            steps=[
-                FetchDataframeStep(integration='mysql',
-                                   query=Select(targets=[
-                                       Identifier(parts=['ta', group_by_column], alias=Identifier(group_by_column))],
-                                       from_table=Identifier('data.ny_output', alias=Identifier('ta')),
-                                       where=BinaryOperation('=', args=[Identifier('ta.vendor_id'), Constant(1)]),
-                                       distinct=True,
-                                   )
-                                   ),
-                MapReduceStep(values=Result(0),
-                              reduce='union',
-                              step=MultipleSteps(
-                                  reduce='union',
-                                  steps=[
-                                      FetchDataframeStep(integration='mysql',
-                                                         query=Select(targets=[Star()],
-                                                                      from_table=Identifier('data.ny_output',
-                                                                                            alias=Identifier('ta')),
-                                                                      where=BinaryOperation('and', args=[
-                                                                          BinaryOperation('and', args=[
-                                                                              BinaryOperation('<',
-                                                                                              args=[Identifier(
-                                                                                                  'ta.pickup_hour'),
-                                                                                                  Constant(10)]),
-                                                                              BinaryOperation('=',
-                                                                                              args=[Identifier(
-                                                                                                  'ta.vendor_id'),
-                                                                                                  Constant(1)]),
-                                                                          ]),
-                                                                          BinaryOperation('=', args=[
-                                                                              Identifier('ta.vendor_id'),
-                                                                              Constant('$var')])
-                                                                      ]),
-                                                                      order_by=[OrderBy(Identifier('ta.pickup_hour'),
-                                                                                        direction='DESC')],
-                                                                      limit=Constant(predictor_window),
-                                                                      ),
-                                                         ),
-                                      FetchDataframeStep(integration='mysql',
-                                                         query=Select(targets=[Star()],
-                                                                      from_table=Identifier('data.ny_output',
-                                                                                            alias=Identifier('ta')),
-                                                                      where=BinaryOperation('and', args=[
-                                                                          BinaryOperation('and', args=[
-                                                                              BinaryOperation('>=',
-                                                                                              args=[Identifier(
-                                                                                                  'ta.pickup_hour'),
-                                                                                                  Constant(10)]),
-                                                                              BinaryOperation('=',
-                                                                                              args=[Identifier(
-                                                                                                  'ta.vendor_id'),
-                                                                                                  Constant(1)]),
-                                                                          ]),
-
-                                                                          BinaryOperation('=', args=[
-                                                                              Identifier('ta.vendor_id'),
-                                                                              Constant('$var')])
-                                                                      ]),
-                                                                      order_by=[OrderBy(Identifier('ta.pickup_hour'),
-                                                                                        direction='DESC')],
-                                                                      ),
-                                                         ),
-
-                                  ]
-                              )),
-                ApplyTimeseriesPredictorStep(output_time_filter=BinaryOperation('>=', args=[Identifier('ta.pickup_hour'), Constant(10)]),
-                                             namespace='mindsdb',
-                                             predictor=Identifier('tp3', alias=Identifier('tb')),
-                                             dataframe=Result(1)),
-                JoinStep(left=Result(2),
-                         right=Result(1),
-                         query=Join(
-                             left=Identifier('result_2', alias=Identifier('tb')),
-                             right=Identifier('result_1', alias=Identifier('ta')),
-                             join_type=JoinType.LEFT_JOIN)
-                         ),
-                ProjectStep(dataframe=Result(3), columns=[Star()]),
-            ],
-        )
+        assert plan == expected_plan
 
-        plan = plan_query(query,
-                          integrations=['mysql'],
-                          predictor_namespace='mindsdb',
-                          predictor_metadata={
-                              'tp3': {'timeseries': True,
-                                       'order_by_column': 'pickup_hour',
-                                       'group_by_column': 'vendor_id',
-                                       'window': predictor_window}
-                          })
-
-        for i in range(len(plan.steps)):
-            assert plan.steps[i] == expected_plan.steps[i]
-
-    def test_join_predictor_timeseries_concrete_date_less(self):
+    @pytest.mark.parametrize('op, window_op', [
+        ('>', '<='),
+        ('>=', '<'),
+        ('<', None),
+        ('<=', None),
+    ], ids=['greater', 'greater_or_equal', 'less', 'less_or_equal'])
+    def test_join_predictor_timeseries_concrete_date(self, op, window_op):
+        # A lower bound on time also needs the last `window` rows before it, fetched by a separate step
         predictor_window = 10
-        group_by_column = 'vendor_id'
 
-        sql = "select * from mysql.data.ny_output as ta join mindsdb.tp3 as tb where ta.pickup_hour < 10 and ta.vendor_id = 1"
-        query = Select(targets=[Star()],
-                       from_table=Join(left=Identifier('mysql.data.ny_output', alias=Identifier('ta')),
-                                       right=Identifier('mindsdb.tp3', alias=Identifier('tb')),
-                                       join_type='join'),
-                       where=BinaryOperation('and', args=[
-                           BinaryOperation('<', args=[Identifier('ta.pickup_hour'), Constant(10)]),
-                           BinaryOperation('=', args=[Identifier(parts=['ta', group_by_column]), Constant(1)]),
-                       ]),
-                       )
+        sql = f"select * from mysql.data.ny_output as ta join mindsdb.tp3 as tb where ta.pickup_hour {op} 10 and ta.vendor_id = 1"
+        query = ts_join_query(where=and_conditions(time_filter(op), vendor_filter()))
 
-        assert parse_sql(sql, dialect='mindsdb').to_tree() == query.to_tree()
-
-        expected_plan = QueryPlan(
-            steps=[
-                FetchDataframeStep(integration='mysql',
-                                   query=Select(targets=[
-                                       Identifier(parts=['ta', group_by_column], alias=Identifier(group_by_column))],
-                                       from_table=Identifier('data.ny_output', alias=Identifier('ta')),
-                                       where=BinaryOperation('=', args=[Identifier('ta.vendor_id'), Constant(1)]),
-                                       distinct=True,
-                                   )
-                                   ),
-                MapReduceStep(values=Result(0),
-                              reduce='union',
-                              step=FetchDataframeStep(integration='mysql',
-                                                         query=Select(targets=[Star()],
-                                                                      from_table=Identifier('data.ny_output',
-                                                                                            alias=Identifier('ta')),
-                                                                      where=BinaryOperation('and', args=[
-                                                                          BinaryOperation('and', args=[
-                                                                              BinaryOperation('<',
-                                                                                              args=[Identifier(
-                                                                                                  'ta.pickup_hour'),
-                                                                                                  Constant(10)]),
-                                                                              BinaryOperation('=',
-                                                                                              args=[Identifier(
-                                                                                                  'ta.vendor_id'),
-                                                                                                  Constant(1)]),
-                                                                          ]),
-                                                                          BinaryOperation('=', args=[
-                                                                              Identifier('ta.vendor_id'),
-                                                                              Constant('$var')])
-                                                                      ]),
-                                                                      order_by=[OrderBy(Identifier('ta.pickup_hour'),
-                                                                                        direction='DESC')],
-                                                                      ),
-                                                         ),
-                              ),
-                ApplyTimeseriesPredictorStep(
-                    output_time_filter=BinaryOperation('<', args=[Identifier('ta.pickup_hour'), Constant(10)]),
-                    namespace='mindsdb',
-                    predictor=Identifier('tp3', alias=Identifier('tb')),
-                    dataframe=Result(1),
-                ),
-                JoinStep(left=Result(2),
-                         right=Result(1),
-                         query=Join(
-                             left=Identifier('result_2', alias=Identifier('tb')),
-                             right=Identifier('result_1', alias=Identifier('ta')),
-                             join_type=JoinType.LEFT_JOIN)
-                         ),
-                ProjectStep(dataframe=Result(3), columns=[Star()]),
-            ],
-        )
+        assert parse_sql(sql, dialect='mindsdb') == query
 
-        plan = plan_query(query,
-                          integrations=['mysql'],
-                          predictor_namespace='mindsdb',
-                          predictor_metadata={
-                              'tp3': {'timeseries': True,
-                                       'order_by_column': 'pickup_hour',
-                                       'group_by_column': 'vendor_id',
-                                       'window': predictor_window}
-                          })
-
-        for i in range(len(plan.steps)):
-            assert plan.steps[i] == expected_plan.steps[i]
-
-    def test_join_predictor_timeseries_concrete_date_less_or_equal(self):
-        predictor_window = 10
-        group_by_column = 'vendor_id'
+        partition_step = partition_fetch_step(group_fetch_where(time_filter(op), vendor_filter()))
+        if window_op:
+            partition_step = MultipleSteps(
+                reduce='union',
+                steps=[
+                    partition_fetch_step(group_fetch_where(time_filter(window_op), vendor_filter()),
+                                         limit=Constant(predictor_window)),
+                    partition_step,
+                ])
+        expected_plan = make_ts_predictor_plan(partition_step,
+                                               group_where=vendor_filter(),
+                                               output_time_filter=time_filter(op))
 
-        sql = "select * from mysql.data.ny_output as ta join mindsdb.tp3 as tb where ta.pickup_hour <= 10 and ta.vendor_id = 1"
-        query = Select(targets=[Star()],
-                       from_table=Join(left=Identifier('mysql.data.ny_output', alias=Identifier('ta')),
-                                       right=Identifier('mindsdb.tp3', alias=Identifier('tb')),
-                                       join_type='join'),
-                       where=BinaryOperation('and', args=[
-                           BinaryOperation('<=', args=[Identifier('ta.pickup_hour'), Constant(10)]),
-                           BinaryOperation('=', args=[Identifier(parts=['ta', group_by_column]), Constant(1)]),
-                       ]),
-                       )
-
-        assert parse_sql(sql, dialect='mindsdb').to_tree() == query.to_tree()
-
-        expected_plan = QueryPlan(
-            steps=[
-                FetchDataframeStep(integration='mysql',
-                                   query=Select(targets=[
-                                       Identifier(parts=['ta', group_by_column], alias=Identifier(group_by_column))],
-                                       from_table=Identifier('data.ny_output', alias=Identifier('ta')),
-                                       where=BinaryOperation('=', args=[Identifier('ta.vendor_id'), Constant(1)]),
-                                       distinct=True,
-                                   )
-                                   ),
-                MapReduceStep(values=Result(0),
-                              reduce='union',
-                              step=FetchDataframeStep(integration='mysql',
-                                                         query=Select(targets=[Star()],
-                                                                      from_table=Identifier('data.ny_output',
-                                                                                            alias=Identifier('ta')),
-                                                                      where=BinaryOperation('and', args=[
-                                                                          BinaryOperation('and', args=[
-                                                                              BinaryOperation('<=',
-                                                                                              args=[Identifier(
-                                                                                                  'ta.pickup_hour'),
-                                                                                                  Constant(10)]),
-                                                                              BinaryOperation('=',
-                                                                                              args=[Identifier(
-                                                                                                  'ta.vendor_id'),
-                                                                                                  Constant(1)]),
-                                                                          ]),
-                                                                          BinaryOperation('=', args=[
-                                                                              Identifier('ta.vendor_id'),
-                                                                              Constant('$var')])
-                                                                      ]),
-                                                                      order_by=[OrderBy(Identifier('ta.pickup_hour'),
-                                                                                        direction='DESC')],
-                                                                      ),
-                                                         ),
-                              ),
-                ApplyTimeseriesPredictorStep(
-                    output_time_filter=BinaryOperation('<=', args=[Identifier('ta.pickup_hour'), Constant(10)]),
-                    namespace='mindsdb',
-                    predictor=Identifier('tp3', alias=Identifier('tb')),
-                    dataframe=Result(1),
-                ),
-                JoinStep(left=Result(2),
-                         right=Result(1),
-                         query=Join(
-                             left=Identifier('result_2', alias=Identifier('tb')),
-                             right=Identifier('result_1', alias=Identifier('ta')),
-                             join_type=JoinType.LEFT_JOIN)
-                         ),
-                ProjectStep(dataframe=Result(3), columns=[Star()]),
-            ],
-        )
+        plan = plan_query(query, integrations=['mysql'], predictor_metadata=ts_predictor_metadata(predictor_window))
 
-        plan = plan_query(query,
-                          integrations=['mysql'],
-                          predictor_namespace='mindsdb',
-                          predictor_metadata={
-                              'tp3': {'timeseries': True,
-                                       'order_by_column': 'pickup_hour',
-                                       'group_by_column': 'vendor_id',
-                                       'window': predictor_window}
-                          })
-
-        for i in range(len(plan.steps)):
-            assert plan.steps[i] == expected_plan.steps[i]
-        
+        assert plan == expected_plan
 
     def test_join_predictor_timeseries_error_on_nested_where(self):
         query = Select(targets=[Identifier('pred.time'), Identifier('pred.price')],
@@ -869,117 +237,23 @@ class TestJoinTimeseriesPredictor:
                        })
 
     def test_join_predictor_timeseries_default_namespace_predictor(self):
-        predictor_window = 10
-        group_by_column = 'vendor_id'
-        query = Select(targets=[Star()],
-                       from_table=Join(left=Identifier('mysql.data.ny_output', alias=Identifier('ta')),
-                                       right=Identifier('tp3', alias=Identifier('tb')),
-                                       join_type='join'),
-                       )
-
-        expected_plan = QueryPlan(
-            default_namespace='mindsdb',
-            steps=[
-                FetchDataframeStep(integration='mysql',
-                                   query=Select(targets=[Identifier(parts=['ta', group_by_column], alias=Identifier(group_by_column))],
-                                                from_table=Identifier('data.ny_output', alias=Identifier('ta')),
-                                                distinct=True,
-                                                )
-                                   ),
-                MapReduceStep(values=Result(0),
-                              reduce='union',
-                              step=FetchDataframeStep(integration='mysql',
-                                   query=Select(targets=[Star()],
-                                                from_table=Identifier('data.ny_output', alias=Identifier('ta')),
-                                                where=BinaryOperation('=', args=[Identifier('ta.vendor_id'), Constant('$var')]),
-                                                order_by=[OrderBy(Identifier('ta.pickup_hour'), direction='DESC')],
-                                                )
-                                   ),
-                              ),
-                ApplyTimeseriesPredictorStep(
-                    namespace='mindsdb',
-                    predictor=Identifier('tp3', alias=Identifier('tb')),
-                    dataframe=Result(1),
-                ),
-                JoinStep(left=Result(2),
-                         right=Result(1),
-                         query=Join(
-                             left=Identifier('result_2', alias=Identifier('tb')),
-                             right=Identifier('result_1', alias=Identifier('ta')),
-                             join_type=JoinType.LEFT_JOIN)
-                         ),
-                ProjectStep(dataframe=Result(3), columns=[Star()]),
-            ],
-        )
+        query = ts_join_query(right='tp3')
+        expected_plan = make_ts_predictor_plan(partition_fetch_step(group_fetch_where()), default_namespace='mindsdb')
 
         plan = plan_query(query,
                           integrations=['mysql'],
-                          predictor_namespace='mindsdb',
                           default_namespace='mindsdb',
-                          predictor_metadata={
-                              'tp3': {'timeseries': True,
-                                       'order_by_column': 'pickup_hour',
-                                       'group_by_column': group_by_column,
-                                       'window': predictor_window}
-                          })
+                          predictor_metadata=ts_predictor_metadata())
 
-        for i in range(len(plan.steps)):
-            assert plan.steps[i] == expected_plan.steps[i]
+        assert plan == expected_plan
 
     def test_join_predictor_timeseries_default_namespace_integration(self):
-        predictor_window = 10
-        group_by_column = 'vendor_id'
-        query = Select(targets=[Star()],
-                       from_table=Join(left=Identifier('data.ny_output', alias=Identifier('ta')),
-                                       right=Identifier('mindsdb.tp3', alias=Identifier('tb')),
-                                       join_type='join'),
-                       )
-
-        expected_plan = QueryPlan(
-            default_namespace='mysql',
-            steps=[
-                FetchDataframeStep(integration='mysql',
-                                   query=Select(targets=[Identifier(parts=['ta', group_by_column], alias=Identifier(group_by_column))],
-                                                from_table=Identifier('data.ny_output', alias=Identifier('ta')),
-                                                distinct=True,
-                                                )
-                                   ),
-                MapReduceStep(values=Result(0),
-                              reduce='union',
-                              step=FetchDataframeStep(integration='mysql',
-                                   query=Select(targets=[Star()],
-                                                from_table=Identifier('data.ny_output', alias=Identifier('ta')),
-                                                where=BinaryOperation('=', args=[Identifier('ta.vendor_id'), Constant('$var')]),
-                                                order_by=[OrderBy(Identifier('ta.pickup_hour'), direction='DESC')],
-                                                )
-                                   ),
-                              ),
-                ApplyTimeseriesPredictorStep(
-                    namespace='mindsdb',
-                    predictor=Identifier('tp3', alias=Identifier('tb')),
-                    dataframe=Result(1),
-                ),
-                JoinStep(left=Result(2),
-                         right=Result(1),
-                         query=Join(
-                             left=Identifier('result_2', alias=Identifier('tb')),
-                             right=Identifier('result_1', alias=Identifier('ta')),
-                             join_type=JoinType.LEFT_JOIN)
-                         ),
-                ProjectStep(dataframe=Result(3), columns=[Star()]),
-            ],
-        )
+        query = ts_join_query(left='data.ny_output')
+        expected_plan = make_ts_predictor_plan(partition_fetch_step(group_fetch_where()), default_namespace='mysql')
 
         plan = plan_query(query,
                           integrations=['mysql'],
-                          predictor_namespace='mindsdb',
                           default_namespace='mysql',
-                          predictor_metadata={
-                              'tp3': {'timeseries': True,
-                                       'order_by_column': 'pickup_hour',
-                                       'group_by_column': group_by_column,
-                                       'window': predictor_window}
-                          })
-
-        for i in range(len(plan.steps)):
-            assert plan.steps[i] == expected_plan.steps[i]
+                          predictor_metadata=ts_predictor_metadata())
+
+        assert plan == expected_plan